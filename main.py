@@ -4,22 +4,25 @@ AKSHARA - PDF Reader with Text-to-Speech
 Main application entry point.
 """
 
+import multiprocessing
 import sys
 import os
 
 # Add src to path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from PyQt6.QtWidgets import QApplication
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QFont
-
-from src.main_window import MainWindow
-from src.splash_screen import SplashController
-
 
 def main():
     """Main application entry point."""
+    # Imported here, not at the top: the page render process re-imports this
+    # module on start-up and needs only fitz, not Qt or the TTS stack
+    from PyQt6.QtWidgets import QApplication
+    from PyQt6.QtCore import Qt
+
+    from src.main_window import MainWindow
+    from src.splash_screen import SplashController
+    from src.ui.styles import apply_app_font
+
     # Enable high DPI scaling
     QApplication.setHighDpiScaleFactorRoundingPolicy(
         Qt.HighDpiScaleFactorRoundingPolicy.PassThrough
@@ -32,9 +35,7 @@ def main():
     app.setOrganizationName("AKSHARA")
     
     # Set default font - classical serif
-    font = QFont("Georgia", 10)
-    font.setStyleHint(QFont.StyleHint.Serif)
-    app.setFont(font)
+    apply_app_font(app)
     
     # Create main window (hidden initially)
     window = MainWindow()
@@ -54,4 +55,5 @@ def main():
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()   # frozen builds start the render process via this executable
     main()
@@ -1,24 +1,48 @@
 import os
 import time
+from datetime import datetime
+from functools import lru_cache
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QToolBar, QStatusBar, QFileDialog, QSlider,
     QSpinBox, QToolButton, QMessageBox, QApplication,
     QStackedWidget, QPushButton, QDockWidget, QSizePolicy,
 )
-from PyQt6.QtCore import Qt, pyqtSlot, QTimer, QSize
-from PyQt6.QtGui import QAction, QKeySequence
+from PyQt6.QtCore import Qt, pyqtSlot, QTimer, QSize, QEvent, QRect
+from PyQt6.QtGui import (
+    QAction, QKeySequence, QColor, QPixmap, QPainter, QFont,
+)
 
 from .pdf_handler import PDFDocument
 from .pdf_viewer import PDFViewerWidget
-from .tts_engine import TTSEngine
-from .ui.styles import get_main_stylesheet
+from .tts_engine import TTSEngine, split_into_sentences
+from .ui.styles import apply_main_stylesheet, get_welcome_stylesheet
 from .db import Store
 from .pomodoro import PomodoroPanel
 from .analytics import AnalyticsDialog
 from .library import LibraryPanel
 
 
+_PDF_EXT = (".pdf",)
+
+
+@lru_cache(maxsize=4)
+def _make_icon_pixmap(rgba: int, dpr: float) -> QPixmap:
+    """The welcome glyph shaped once per colour and pixel ratio instead of on every repaint."""
+    # 96x96 logical pixels, drawn at the screen's physical resolution
+    pixmap = QPixmap(round(96 * dpr), round(96 * dpr))
+    pixmap.setDevicePixelRatio(dpr)
+    pixmap.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(pixmap)
+    font = QFont()
+    font.setPixelSize(60)
+    painter.setFont(font)
+    painter.setPen(QColor.fromRgba(rgba))
+    painter.drawText(QRect(0, 0, 96, 96), Qt.AlignmentFlag.AlignCenter, "📖")
+    painter.end()
+    return pixmap
+
+
 class WelcomeWidget(QWidget):
     """Welcome screen — shown when no PDF is loaded."""
 
@@ -26,6 +50,8 @@ class WelcomeWidget(QWidget):
         super().__init__(parent)
         self._dark_mode = dark_mode
         self.setObjectName("welcomeWidget")
+        # Plain QWidget subclasses only paint a sheet background when styled
+        self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
         self._setup_ui()
         self._apply_theme()
 
@@ -34,93 +60,63 @@ class WelcomeWidget(QWidget):
         self._apply_theme()
 
     def _apply_theme(self):
-        from PyQt6.QtGui import QPalette, QColor as QC
-        dark = self._dark_mode
-        bg      = "#000000" if dark else "#ffffff"
-        ink     = "#f0f0f0" if dark else "#0a0a0a"
-        muted   = "#555555" if dark else "#aaaaaa"
-        accent  = "#d8a85a"
-        hint    = "#2a2a2a" if dark else "#eeeeea"
-
-        palette = self.palette()
-        palette.setColor(QPalette.ColorRole.Window, QC(bg))
-        self.setPalette(palette)
-        self.setAutoFillBackground(True)
-
-        self.icon_label.setStyleSheet(
-            f"font-size:60px;background:transparent;color:{ink};"
-        )
-        self.title_label.setStyleSheet(
-            f"font-family:Georgia,serif;font-size:44px;font-weight:300;"
-            f"letter-spacing:10px;color:{ink};background:transparent;"
-        )
-        self.subtitle_label.setStyleSheet(
-            f"font-size:11px;letter-spacing:3px;color:{muted};background:transparent;"
-        )
-        self.open_button.setStyleSheet(f"""
-            QPushButton {{
-                background-color:{accent};
-                color:#000000;
-                border:none;
-                border-radius:6px;
-                padding:14px 44px;
-                font-size:12px;
-                font-weight:700;
-                letter-spacing:2px;
-            }}
-            QPushButton:hover {{ background-color:#e8bb6a; }}
-        """)
-        self.hint_label.setStyleSheet(
-            f"font-family:'Ubuntu Mono','Courier New',monospace;"
-            f"font-size:11px;color:{muted};background:transparent;"
-        )
-        self.shortcuts_widget.setStyleSheet(
-            f"background:{hint};border-radius:8px;"
-        )
-        for label in self._shortcut_labels:
-            label.setStyleSheet(
-                f"font-family:'Ubuntu Mono','Courier New',monospace;"
-                f"font-size:11px;color:{muted};background:transparent;"
-            )
+        # Precomputed per theme; the sheet also paints the page background
+        self.setStyleSheet(get_welcome_stylesheet(self._dark_mode))
+        self._apply_icon()
+
+    def _apply_icon(self):
+        ink = QColor("#f0f0f0" if self._dark_mode else "#0a0a0a")
+        dpr = self.devicePixelRatioF() or 1.0
+        self.icon_label.setPixmap(_make_icon_pixmap(ink.rgba(), dpr))
+
+    def event(self, event):
+        if event.type() == QEvent.Type.DevicePixelRatioChange:
+            self._apply_icon()   # moved to a screen with a different scale
+        return super().event(event)
 
     def _setup_ui(self):
         outer = QVBoxLayout(self)
         outer.setAlignment(Qt.AlignmentFlag.AlignCenter)
         outer.setSpacing(0)
 
-        self.icon_label = QLabel("📖")
+        self.icon_label = QLabel()
+        self.icon_label.setObjectName("iconLabel")
         self.icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         outer.addWidget(self.icon_label)
         outer.addSpacing(16)
 
         self.title_label = QLabel("AKSHARA")
+        self.title_label.setObjectName("titleLabel")
         self.title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         outer.addWidget(self.title_label)
         outer.addSpacing(8)
 
         self.subtitle_label = QLabel("PDF · FOCUS · ANALYTICS")
+        self.subtitle_label.setObjectName("subtitleLabel")
         self.subtitle_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         outer.addWidget(self.subtitle_label)
         outer.addSpacing(36)
 
         self.open_button = QPushButton("Open PDF")
+        self.open_button.setObjectName("openButton")
         self.open_button.setCursor(Qt.CursorShape.PointingHandCursor)
         self.open_button.setFixedWidth(200)
         outer.addWidget(self.open_button, alignment=Qt.AlignmentFlag.AlignCenter)
         outer.addSpacing(10)
 
         self.hint_label = QLabel("or drag a PDF onto this window")
+        self.hint_label.setObjectName("hintLabel")
         self.hint_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         outer.addWidget(self.hint_label)
         outer.addSpacing(40)
 
         # Keyboard shortcuts cheatsheet
         self.shortcuts_widget = QWidget()
+        self.shortcuts_widget.setObjectName("shortcutsPanel")
         self.shortcuts_widget.setFixedWidth(340)
         sc_layout = QVBoxLayout(self.shortcuts_widget)
         sc_layout.setContentsMargins(20, 16, 20, 16)
         sc_layout.setSpacing(6)
-        self._shortcut_labels = []
         shortcuts = [
             ("Space",          "Play / pause reading"),
             ("← →",           "Previous / next page"),
@@ -134,11 +130,12 @@ class WelcomeWidget(QWidget):
             row = QHBoxLayout()
             k = QLabel(key)
             d = QLabel(desc)
+            k.setObjectName("shortcutLabel")
+            d.setObjectName("shortcutLabel")
             row.addWidget(k)
             row.addStretch(1)
             row.addWidget(d)
             sc_layout.addLayout(row)
-            self._shortcut_labels.extend([k, d])
 
         outer.addWidget(self.shortcuts_widget, alignment=Qt.AlignmentFlag.AlignCenter)
 
@@ -158,20 +155,25 @@ class MainWindow(QMainWindow):
         super().__init__()
 
         # Theme state - based on local time (6-18 is light, otherwise dark)
-        from datetime import datetime
         current_hour = datetime.now().hour
         self._dark_mode = not (6 <= current_hour < 18)
         self._text_size_idx = self._TEXT_SIZE_IDX
+        self._applied_dark_mode: bool | None = None   # theme last pushed to widgets
         
         # Initialize components
         self.pdf_doc = PDFDocument(self)
         self.tts_engine = TTSEngine(self)
         
         self.tts_engine.enable_hf(True, voice="af_heart", lang_code="a")
+        # Load the model while the splash plays rather than on the first Read
+        self.tts_engine.warm_up()
 
         self.store = Store()
         self._active_doc_id: str | None = None
         self._page_dwell_started_at: float | None = None
+        # page index → (text, sentences) for the open document
+        self._text_cache: dict[int, tuple[str, list[str]]] = {}
+        self._open_dialog: QFileDialog | None = None   # built on first Open
 
         self.pomodoro = PomodoroPanel(self.store)
         self.pomodoro.phase_completed.connect(self._on_phase_completed)
@@ -201,6 +203,14 @@ class MainWindow(QMainWindow):
         self._library_dock.setMinimumWidth(220)
         self.addDockWidget(Qt.DockWidgetArea.LeftDockWidgetArea, self._library_dock)
 
+        # Re-fit to width once a window resize has settled, unless the user
+        # has zoomed by hand since the document was fitted
+        self._fit_width_mode = True
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(100)
+        self._resize_timer.timeout.connect(self._resize_refit)
+
         self._setup_window()
         self._setup_menu()
         self._setup_toolbar()
@@ -213,6 +223,15 @@ class MainWindow(QMainWindow):
         label, _, _ = self._TEXT_SIZES[self._text_size_idx]
         self.text_size_btn.setText(f"T{label}")
 
+        # Single-key shortcuts handled in keyPressEvent
+        self._key_map = {
+            Qt.Key.Key_Left: self._prev_page,
+            Qt.Key.Key_Right: self._next_page,
+            Qt.Key.Key_Space: self._space_pressed,
+            Qt.Key.Key_Escape: self._stop,
+            Qt.Key.Key_L: self._toggle_library,
+        }
+
         # Enable drag and drop
         self.setAcceptDrops(True)
     
@@ -313,6 +332,7 @@ class MainWindow(QMainWindow):
         toolbar.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextOnly)
         toolbar.setIconSize(QSize(16, 16))
         self.addToolBar(toolbar)
+        self.toolbar = toolbar
 
         # ── Open ──────────────────────────────────────────────────────────────
         self.open_btn = QToolButton()
@@ -427,6 +447,13 @@ class MainWindow(QMainWindow):
         self.speed_slider.valueChanged.connect(self._update_speed)
         speed_lay.addWidget(self.speed_slider)
 
+        # Apply the rate once the slider settles, not on every drag step
+        self._current_speed = 1.0
+        self._speed_timer = QTimer(self)
+        self._speed_timer.setSingleShot(True)
+        self._speed_timer.setInterval(150)
+        self._speed_timer.timeout.connect(self._apply_speed_now)
+
         self.speed_value_label = QLabel("1.0×")
         self.speed_value_label.setObjectName("speedLabel")
         self.speed_value_label.setFixedWidth(36)
@@ -488,19 +515,32 @@ class MainWindow(QMainWindow):
         self.theme_btn.setToolTip("Toggle theme  Ctrl+T")
         self.theme_btn.clicked.connect(self._toggle_theme)
         toolbar.addWidget(self.theme_btn)
+
+        # Enabled together once a document is loaded
+        self._doc_dependent_buttons = [
+            self.page_spin, self.prev_btn, self.next_btn, self.play_btn,
+            self.play_sel_btn, self.zoom_in_btn, self.zoom_out_btn,
+        ]
     
     def _setup_central_widget(self):
         self.stacked_widget = QStackedWidget()
         self.welcome_widget = WelcomeWidget(dark_mode=self._dark_mode)
         self.welcome_widget.open_button.clicked.connect(self._open_file_dialog)
         self.stacked_widget.addWidget(self.welcome_widget)
-        self.pdf_viewer = PDFViewerWidget()
-        self.pdf_viewer.text_selected.connect(self._on_text_selected)
-        self.pdf_viewer.current_page_changed.connect(self._on_visible_page_changed)
-        self.stacked_widget.addWidget(self.pdf_viewer)
+        # Built on the first successful load — see _ensure_pdf_viewer
+        self.pdf_viewer: PDFViewerWidget | None = None
         self.stacked_widget.setCurrentWidget(self.welcome_widget)
         self.setCentralWidget(self.stacked_widget)
 
+    def _ensure_pdf_viewer(self) -> PDFViewerWidget:
+        if self.pdf_viewer is None:
+            self.pdf_viewer = PDFViewerWidget()
+            self.pdf_viewer.set_dark_mode(self._dark_mode)
+            self.pdf_viewer.text_selected.connect(self._on_text_selected)
+            self.pdf_viewer.current_page_changed.connect(self._on_visible_page_changed)
+            self.stacked_widget.addWidget(self.pdf_viewer)
+        return self.pdf_viewer
+
     def _setup_status_bar(self):
         self.status_bar = QStatusBar()
         self.setStatusBar(self.status_bar)
@@ -522,11 +562,14 @@ class MainWindow(QMainWindow):
         self._apply_theme()
 
     def _apply_theme(self):
+        if self._applied_dark_mode == self._dark_mode:
+            return
         self.pdf_doc.dark_mode = self._dark_mode
         _, _, base_px = self._TEXT_SIZES[self._text_size_idx]
-        self.setStyleSheet(get_main_stylesheet(self._dark_mode, base_px))
+        apply_main_stylesheet(self, self._dark_mode, base_px)
         self.welcome_widget.set_dark_mode(self._dark_mode)
-        self.pdf_viewer.set_dark_mode(self._dark_mode)
+        if self.pdf_viewer is not None:
+            self.pdf_viewer.set_dark_mode(self._dark_mode)
         self.pomodoro.set_dark_mode(self._dark_mode)
         self.library.set_dark_mode(self._dark_mode)
         if self._dark_mode:
@@ -537,6 +580,7 @@ class MainWindow(QMainWindow):
             self.theme_btn.setText("🌙")
             self.theme_btn.setToolTip("Switch to Dark Mode (Ctrl+T)")
             self.theme_action.setText("Switch to &Dark Mode")
+        self._applied_dark_mode = self._dark_mode
 
     def _cycle_text_size(self):
         self._text_size_idx = (self._text_size_idx + 1) % len(self._TEXT_SIZES)
@@ -549,20 +593,26 @@ class MainWindow(QMainWindow):
         font.setPointSize(pt)
         QApplication.setFont(font)
         _, _, base_px = self._TEXT_SIZES[self._text_size_idx]
-        self.setStyleSheet(get_main_stylesheet(self._dark_mode, base_px))
+        apply_main_stylesheet(self, self._dark_mode, base_px)
     
     def _open_file_dialog(self):
-        file_path, _ = QFileDialog.getOpenFileName(
-            self, "Open PDF", "", "PDF Files (*.pdf);;All Files (*)"
-        )
-        if file_path:
-            self._load_pdf(file_path)
+        # One long-lived, non-blocking dialog; it also remembers the last folder
+        if self._open_dialog is None:
+            self._open_dialog = QFileDialog(
+                self, "Open PDF", "", "PDF Files (*.pdf);;All Files (*)"
+            )
+            self._open_dialog.setFileMode(QFileDialog.FileMode.ExistingFile)
+            self._open_dialog.fileSelected.connect(self._load_pdf)
+        self._open_dialog.open()
     
     def _load_pdf(self, file_path: str):
         self.status_label.setText(f"Loading: {os.path.basename(file_path)}...")
-        QApplication.processEvents()
-        
+        # Next tick: the status label paints before the (blocking) load starts
+        QTimer.singleShot(0, lambda: self._do_load(file_path))
+
+    def _do_load(self, file_path: str):
         if self.pdf_doc.load(file_path):
+            self._text_cache.clear()
             self._active_doc_id = self.store.upsert_document(
                 file_path=file_path,
                 title=self.pdf_doc.title,
@@ -572,10 +622,18 @@ class MainWindow(QMainWindow):
             self.pomodoro.set_active_document(self._active_doc_id)
             self._page_dwell_started_at = time.time()
             self.library.refresh()
-            self.stacked_widget.setCurrentWidget(self.pdf_viewer)
-            QTimer.singleShot(50, self._fit_and_load)
+            viewer = self._ensure_pdf_viewer()
+            if viewer.isVisible():
+                self._fit_and_load()
+            else:
+                # Fit once the viewport has been laid out at its real size
+                viewer.viewport_ready.connect(
+                    self._fit_and_load, Qt.ConnectionType.SingleShotConnection
+                )
+            self.stacked_widget.setCurrentWidget(viewer)
 
     def _fit_and_load(self):
+        self._fit_width_mode = True
         self._fit_to_width()
         self.pdf_viewer.load_document(
             self.pdf_doc._doc,
@@ -584,17 +642,22 @@ class MainWindow(QMainWindow):
         )
     
     def _prev_page(self):
+        if self.pdf_viewer is None:
+            return
         cur = self.pdf_viewer.current_page
         if cur > 0:
             self.pdf_viewer.go_to_page(cur - 1)
 
     def _next_page(self):
+        if self.pdf_viewer is None or not self.pdf_doc.is_loaded:
+            return
         cur = self.pdf_viewer.current_page
-        if self.pdf_doc.is_loaded and cur < self.pdf_doc.page_count - 1:
+        if cur < self.pdf_doc.page_count - 1:
             self.pdf_viewer.go_to_page(cur + 1)
 
     def _go_to_page(self, page_num: int):
-        self.pdf_viewer.go_to_page(page_num - 1)
+        if self.pdf_viewer is not None:
+            self.pdf_viewer.go_to_page(page_num - 1)
 
     @pyqtSlot(int)
     def _on_visible_page_changed(self, page_index: int):
@@ -619,13 +682,15 @@ class MainWindow(QMainWindow):
             )
     
     def _zoom_in(self):
-        if self.pdf_doc.zoom < 3.0:
+        if self.pdf_viewer is not None and self.pdf_doc.zoom < 3.0:
+            self._fit_width_mode = False
             self.pdf_doc.zoom = round(self.pdf_doc.zoom + 0.25, 2)
             self._update_zoom_label()
             self.pdf_viewer.set_zoom(self.pdf_doc.zoom)
 
     def _zoom_out(self):
-        if self.pdf_doc.zoom > 0.5:
+        if self.pdf_viewer is not None and self.pdf_doc.zoom > 0.5:
+            self._fit_width_mode = False
             self.pdf_doc.zoom = round(self.pdf_doc.zoom - 0.25, 2)
             self._update_zoom_label()
             self.pdf_viewer.set_zoom(self.pdf_doc.zoom)
@@ -640,7 +705,7 @@ class MainWindow(QMainWindow):
         viewer_width = self.pdf_viewer.scroll_area.viewport().width() - 40
         if viewer_width <= 0:
             viewer_width = 800
-        optimal_zoom = viewer_width / (page_width * 1.5)
+        optimal_zoom = viewer_width / page_width
         optimal_zoom = max(0.5, min(round(optimal_zoom * 4) / 4, 3.0))
         self.pdf_doc.zoom = optimal_zoom
         self._update_zoom_label()
@@ -648,18 +713,31 @@ class MainWindow(QMainWindow):
     def _play_page(self):
         if not self.pdf_doc.is_loaded:
             return
-        text = self.pdf_doc.extract_text(self.pdf_viewer.current_page)
+        text, sentences = self._get_page_text(self.pdf_viewer.current_page)
         if text.strip():
             self.pdf_viewer.reset_read_position()
-            self.tts_engine.speak(text)
+            self.tts_engine.speak_stream(sentences)
         else:
             self.status_label.setText("No text found on this page")
+
+    def _get_page_text(self, page_index: int) -> tuple[str, list[str]]:
+        cached = self._text_cache.get(page_index)
+        if cached is None:
+            # Reuse the text the viewer pulled out while rendering the page
+            text = self.pdf_viewer.page_text(page_index)
+            if text is None:
+                text = self.pdf_doc.extract_text(page_index)
+            cached = (text, split_into_sentences(text))
+            self._text_cache[page_index] = cached
+        return cached
     
     def _play_selection(self):
+        if self.pdf_viewer is None:
+            return
         selected = self.pdf_viewer.get_selected_text()
         if selected.strip():
             self.pdf_viewer.reset_read_position()
-            self.tts_engine.speak(selected)
+            self.tts_engine.speak_stream(split_into_sentences(selected))
         else:
             self.status_label.setText("Select text on the PDF first")
     
@@ -677,13 +755,17 @@ class MainWindow(QMainWindow):
     def _stop(self):
         self.tts_engine.stop()
         self._update_tts_buttons(False)
-        self.pdf_viewer.highlight_text("")
+        if self.pdf_viewer is not None:
+            self.pdf_viewer.highlight_text("")
         self.tts_status_label.setText("")
     
     def _update_speed(self, value: int):
-        speed = value / 100.0
-        self.speed_value_label.setText(f"{speed:.1f}x")
-        self.tts_engine.set_rate_multiplier(speed)
+        self._current_speed = value / 100.0
+        self.speed_value_label.setText(f"{self._current_speed:.1f}x")
+        self._speed_timer.start()
+
+    def _apply_speed_now(self):
+        self.tts_engine.set_rate_multiplier(self._current_speed)
 
     def _update_tts_buttons(self, playing: bool):
         self.pause_btn.setEnabled(playing)
@@ -693,18 +775,18 @@ class MainWindow(QMainWindow):
     @pyqtSlot(int)
     def _on_document_loaded(self, page_count: int):
         self.setWindowTitle(f"AKSHARA - {self.pdf_doc.title}")
-        
-        self.page_spin.setMaximum(page_count)
-        self.page_spin.setValue(1)
-        self.page_spin.setEnabled(True)
-        self.page_total_label.setText(f" / {page_count}")
-        
-        self.prev_btn.setEnabled(True)
-        self.next_btn.setEnabled(True)
-        self.play_btn.setEnabled(True)
-        self.play_sel_btn.setEnabled(True)
-        self.zoom_in_btn.setEnabled(True)
-        self.zoom_out_btn.setEnabled(True)
+
+        # One toolbar repaint for the whole batch
+        self.toolbar.setUpdatesEnabled(False)
+        try:
+            self.page_spin.setMaximum(page_count)
+            self.page_spin.setValue(1)
+            self.page_total_label.setText(f" / {page_count}")
+            for widget in self._doc_dependent_buttons:
+                widget.setEnabled(True)
+        finally:
+            self.toolbar.setUpdatesEnabled(True)
+            self.toolbar.update()
         
         self.status_label.setText(f"Loaded: {self.pdf_doc.title} ({page_count} pages)")
     
@@ -764,38 +846,52 @@ class MainWindow(QMainWindow):
             "</ul>"
         )
     
+    @staticmethod
+    def _dragged_pdf(mime) -> str:
+        """Local path of the first dragged URL if it is a PDF, else ""."""
+        if not mime.hasUrls():
+            return ""
+        urls = mime.urls()
+        path = urls[0].toLocalFile() if urls else ""
+        return path if path.lower().endswith(_PDF_EXT) else ""
+
     def dragEnterEvent(self, event):
-        if event.mimeData().hasUrls():
-            urls = event.mimeData().urls()
-            if urls and urls[0].toLocalFile().lower().endswith('.pdf'):
-                event.acceptProposedAction()
+        if self._dragged_pdf(event.mimeData()):
+            event.acceptProposedAction()
     
     def dropEvent(self, event):
-        urls = event.mimeData().urls()
-        if urls:
-            file_path = urls[0].toLocalFile()
-            if file_path.lower().endswith('.pdf'):
-                self._load_pdf(file_path)
+        file_path = self._dragged_pdf(event.mimeData())
+        if file_path:
+            self._load_pdf(file_path)
     
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._resize_timer.start()
+
+    def _resize_refit(self):
+        if self.pdf_viewer is None or not self.pdf_doc.is_loaded or not self._fit_width_mode:
+            return
+        self._fit_to_width()
+        # No-op when the fitted zoom is unchanged
+        self.pdf_viewer.set_zoom(self.pdf_doc.zoom)
+
     def keyPressEvent(self, event):
-        if event.key() == Qt.Key.Key_Left:
-            self._prev_page()
-        elif event.key() == Qt.Key.Key_Right:
-            self._next_page()
-        elif event.key() == Qt.Key.Key_Space:
-            if self.tts_engine.is_speaking:
-                self._toggle_pause()
-            elif self.pdf_doc.is_loaded:
-                self._play_page()
-        elif event.key() == Qt.Key.Key_Escape:
-            self._stop()
-        elif event.key() == Qt.Key.Key_L:
-            self._toggle_library()
+        handler = self._key_map.get(event.key())
+        if handler is not None:
+            handler()
         else:
             super().keyPressEvent(event)
+
+    def _space_pressed(self):
+        if self.tts_engine.is_speaking:
+            self._toggle_pause()
+        elif self.pdf_doc.is_loaded:
+            self._play_page()
     
     def closeEvent(self, event):
         self.tts_engine.cleanup()
+        if self.pdf_viewer is not None:
+            self.pdf_viewer.shutdown()
         self.pdf_doc.close()
         self.pomodoro.reset()
         self.store.close()
@@ -1,8 +1,13 @@
 import fitz
+from collections import OrderedDict
 from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtGui import QImage, QPixmap
 from typing import Optional
 
 
+THUMB_CACHE_SIZE = 64   # thumbnails are small; keep far more than full pages
+
+
 class PDFDocument(QObject):
     document_loaded = pyqtSignal(int)
     error_occurred = pyqtSignal(str)
@@ -14,6 +19,8 @@ class PDFDocument(QObject):
         self._zoom: float = 1.0
         self._file_path: str = ""
         self.dark_mode: bool = True
+        # (page_num, max_side, dark_mode) → QPixmap, LRU order
+        self._thumb_cache: OrderedDict[tuple, QPixmap] = OrderedDict()
 
     @property
     def is_loaded(self) -> bool:
@@ -57,6 +64,7 @@ class PDFDocument(QObject):
             return False
 
     def close(self):
+        self._thumb_cache.clear()
         if self._doc:
             self._doc.close()
             self._doc = None
@@ -72,6 +80,32 @@ class PDFDocument(QObject):
         except Exception:
             return 0.0, 0.0
 
+    def render_thumbnail(self, page_num: int, max_side: int) -> Optional[QPixmap]:
+        """Render a page straight at thumbnail size (longest side = max_side px)."""
+        if not self._doc:
+            return None
+        key = (page_num, max_side, self.dark_mode)
+        cached = self._thumb_cache.get(key)
+        if cached is not None:
+            self._thumb_cache.move_to_end(key)
+            return cached
+        try:
+            page = self._doc[page_num]
+            scale = max_side / max(page.rect.width, page.rect.height)
+            pix = page.get_pixmap(matrix=fitz.Matrix(scale, scale), alpha=False)
+            if self.dark_mode:
+                pix.invert_irect()
+            img = QImage(pix.samples_mv, pix.width, pix.height, pix.stride,
+                         QImage.Format.Format_RGB888)
+            pixmap = QPixmap.fromImage(img)   # copies out before pix is freed
+        except Exception as e:
+            self.error_occurred.emit(f"Failed to render thumbnail: {e}")
+            return None
+        self._thumb_cache[key] = pixmap
+        if len(self._thumb_cache) > THUMB_CACHE_SIZE:
+            self._thumb_cache.popitem(last=False)
+        return pixmap
+
     def extract_text(self, page_num: Optional[int] = None) -> str:
         if not self._doc:
             return ""
@@ -1,15 +1,25 @@
+import multiprocessing
+
 import fitz  # PyMuPDF
 from PyQt6.QtWidgets import (
     QWidget, QScrollArea, QVBoxLayout, QApplication, QMenu, QSizePolicy,
 )
-from PyQt6.QtCore import Qt, QRect, QPoint, QRectF, pyqtSignal, QTimer, QSize
+from PyQt6.QtCore import (
+    Qt, QRect, QPoint, QPointF, QRectF, pyqtSignal, QTimer, QSize,
+    QObject, QThread, pyqtSlot,
+)
 from PyQt6.QtGui import (
-    QPainter, QImage, QPixmap, QColor, QPen, QBrush,
+    QPainter, QPainterPath, QImage, QPixmap, QColor, QPen, QBrush,
     QMouseEvent, QPaintEvent,
 )
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
 from typing import Optional, List
 from dataclasses import dataclass
 
+from .render_process import render_server
+from .ui.styles import get_pdf_viewer_stylesheet
+
 
 @dataclass
 class TextSpan:
@@ -17,8 +27,122 @@ class TextSpan:
     bbox: QRectF
 
 
+# ---------- Background rendering -------------------------------------------
+
+def _spans_from_words(words: list) -> List[TextSpan]:
+    return [
+        TextSpan(text=w[4], bbox=QRectF(w[0], w[1], w[2] - w[0], w[3] - w[1]))
+        for w in words
+    ]
+
+
+class PageRenderWorker(QObject):
+    """
+    Drives the render process from a dedicated QThread. MuPDF runs in that
+    child process, which owns the only fitz.Document used for drawing and
+    reopens it only when the viewer moves to a new document generation. This
+    thread just waits on the pipe — which releases the GIL — and wraps the
+    returned samples in a QImage, so the GUI thread never waits on MuPDF.
+    Each page's samples are copied once, across the pipe; the QImage then
+    wraps the received bytes without copying them again.
+    """
+
+    # generation, cache key, (QImage, text_spans, page_text, scale) or None on failure;
+    # text_spans and page_text are None unless the request asked for them
+    rendered = pyqtSignal(int, object, object)
+    # generation, page_index, (text_spans, page_text) or None on failure
+    extracted = pyqtSignal(int, int, object)
+
+    def __init__(self):
+        super().__init__()
+        self.generation = 0   # written by the GUI thread; older requests are skipped
+        self._process = None
+        self._conn = None
+
+    @pyqtSlot()
+    def start(self):
+        """Launch the render process ahead of the first page."""
+        if self._process is not None and self._process.is_alive():
+            return
+        self.stop()
+        # spawn, not fork: the GUI process is multi-threaded
+        ctx = multiprocessing.get_context("spawn")
+        self._conn, child_conn = ctx.Pipe()
+        self._process = ctx.Process(target=render_server, args=(child_conn,),
+                                    name="akshara-render", daemon=True)
+        self._process.start()
+        child_conn.close()
+
+    def stop(self):
+        """Shut the render process down. Call once its thread has finished."""
+        if self._process is None:
+            return
+        try:
+            self._conn.send(None)
+        except (OSError, ValueError):
+            pass
+        self._process.join(timeout=1.0)
+        if self._process.is_alive():
+            self._process.terminate()
+            self._process.join()
+        self._conn.close()
+        self._process = None
+        self._conn = None
+
+    def _call(self, request: tuple):
+        """One request/reply round trip; restarts the process if it died."""
+        self.start()
+        try:
+            self._conn.send(request)
+            header = self._conn.recv()
+            if header is None or request[0] != "render":
+                return header, None
+            return header, self._conn.recv_bytes()
+        except (EOFError, OSError):
+            # Crashed on a bad page: start afresh on the next request
+            self.stop()
+            return None, None
+
+    @pyqtSlot(int, str, object, bool)
+    def render(self, generation: int, file_path: str, key: tuple, want_spans: bool):
+        if generation != self.generation:
+            return
+        page_index, zoom, dark_mode, dpr = key
+        # Rasterise at physical resolution; spans stay in logical pixels
+        header, samples = self._call(("render", file_path, generation, page_index,
+                                      zoom * dpr, dark_mode, want_spans))
+        result = None
+        if header is not None:
+            width, height, stride, words, text = header
+            # Wraps the bytes read off the pipe, which are the page's only copy
+            img = QImage(samples, width, height, stride, QImage.Format.Format_RGB888)
+            # Repack into Qt's native 32-bit layout here, so QPixmap.fromImage
+            # on the GUI thread is a plain upload. The result owns its pixels.
+            img = img.convertToFormat(QImage.Format.Format_RGB32)
+            spans = _spans_from_words(words) if words is not None else None
+            result = (img, spans, text, zoom)
+        self.rendered.emit(generation, key, result)
+
+    @pyqtSlot(int, str, int)
+    def extract(self, generation: int, file_path: str, page_index: int):
+        """Text only — for pages whose pixels were prefetched without it."""
+        if generation != self.generation:
+            return
+        header, _ = self._call(("text", file_path, generation, page_index))
+        result = None
+        if header is not None:
+            words, text = header
+            result = (_spans_from_words(words), text)
+        self.extracted.emit(generation, page_index, result)
+
+
+
 # ---------- Single-page widget -----------------------------------------------
 
+GRID_CELL = 64          # px per spatial-index cell for span hit-tests
+GRID_MIN_SPANS = 50     # below this a linear scan is cheaper than the index
+
+
 class PDFPageWidget(QWidget):
     """
     Renders one PDF page with text selection and TTS highlighting.
@@ -33,9 +157,14 @@ class PDFPageWidget(QWidget):
         self.page_index: int = -1
         self._pixmap: Optional[QPixmap] = None
         self._text_spans: List[TextSpan] = []
-        self._scale: float = 1.5
+        self._scale: float = 1.0
+        self._span_rects: List[QRectF] = []   # span bboxes in widget pixels
+        self._grid: dict[tuple[int, int], list[int]] = {}   # cell → overlapping span indices
         self._full_text: str = ""
+        self._full_text_norm: str = ""       # lower-cased, whitespace collapsed
+        self._norm_to_orig: list[int] = []   # _full_text_norm index → _full_text index
         self._span_char_ranges: list[tuple[int, int]] = []
+        self._span_ends: list[int] = []       # end offsets, ascending — for bisect
 
         self._selection_start: Optional[QPoint] = None
         self._selection_end: Optional[QPoint] = None
@@ -43,6 +172,12 @@ class PDFPageWidget(QWidget):
         self._is_selecting = False
         self._show_selection = True
 
+        # Drag-select work runs at most once per frame, not per mouse event
+        self._selection_timer = QTimer(self)
+        self._selection_timer.setSingleShot(True)
+        self._selection_timer.setInterval(16)
+        self._selection_timer.timeout.connect(self._apply_selection_update)
+
         self._tts_char_start: int = -1
         self._tts_char_end: int = -1
         self._tts_highlight_spans: List[int] = []
@@ -65,15 +200,27 @@ class PDFPageWidget(QWidget):
         self._build_text_map()
         self.clear_selection()
         self.clear_tts_highlight()
-        self.setFixedSize(pixmap.size())
+        self.setFixedSize(pixmap.deviceIndependentSize().toSize())
         self.update()
 
+    def set_text_spans(self, text_spans: List[TextSpan]):
+        """Attach spans that arrived after the pixmap (prefetched pages)."""
+        self._text_spans = text_spans
+        self._build_text_map()
+        self.clear_selection()
+        self.clear_tts_highlight()
+
     def release(self):
         self.page_index = -1
         self._pixmap = None
         self._text_spans = []
+        self._span_rects = []
+        self._grid = {}
         self._full_text = ""
+        self._full_text_norm = ""
+        self._norm_to_orig = []
         self._span_char_ranges = []
+        self._span_ends = []
         self.clear_selection()
         self.clear_tts_highlight()
         self.hide()
@@ -84,6 +231,14 @@ class PDFPageWidget(QWidget):
     # ---- text map ----
 
     def _build_text_map(self):
+        # Scaled once per assignment; paint and hit-tests read these directly
+        sc = self._scale
+        self._span_rects = [
+            QRectF(s.bbox.x() * sc, s.bbox.y() * sc,
+                   s.bbox.width() * sc, s.bbox.height() * sc)
+            for s in self._text_spans
+        ]
+        self._build_grid()
         parts = []
         self._span_char_ranges = []
         char_pos = 0
@@ -94,6 +249,59 @@ class PDFPageWidget(QWidget):
             parts.append(span.text)
             char_pos = end + 1
         self._full_text = " ".join(parts)
+        self._span_ends = [e for _, e in self._span_char_ranges]
+        self._build_normalized_text()
+
+    def _build_normalized_text(self):
+        """Normalise once per page; TTS lookups then only normalise the query."""
+        chars: list[str] = []
+        to_orig: list[int] = []
+        pending_space = -1
+        for i, c in enumerate(self._full_text):
+            if c.isspace():
+                if pending_space < 0:
+                    pending_space = i
+                continue
+            if pending_space >= 0 and chars:
+                chars.append(" ")
+                to_orig.append(pending_space)
+            pending_space = -1
+            for lc in c.lower():
+                chars.append(lc)
+                to_orig.append(i)
+        self._full_text_norm = "".join(chars)
+        self._norm_to_orig = to_orig
+
+    def _build_grid(self):
+        """Bin each span into every GRID_CELL square it overlaps."""
+        self._grid = {}
+        if len(self._span_rects) < GRID_MIN_SPANS:
+            return
+        for i, r in enumerate(self._span_rects):
+            for cx in range(int(r.left()) // GRID_CELL, int(r.right()) // GRID_CELL + 1):
+                for cy in range(int(r.top()) // GRID_CELL, int(r.bottom()) // GRID_CELL + 1):
+                    self._grid.setdefault((cx, cy), []).append(i)
+
+    def _spans_near(self, rect: QRectF):
+        """Span indices, in order, that may intersect rect (every span without a grid)."""
+        if not self._grid:
+            return range(len(self._span_rects))
+        found: set[int] = set()
+        for cx in range(int(rect.left()) // GRID_CELL, int(rect.right()) // GRID_CELL + 1):
+            for cy in range(int(rect.top()) // GRID_CELL, int(rect.bottom()) // GRID_CELL + 1):
+                found.update(self._grid.get((cx, cy), ()))
+        return sorted(found)
+
+    def _span_at(self, pos: QPointF) -> int:
+        if self._grid:
+            cell = (int(pos.x()) // GRID_CELL, int(pos.y()) // GRID_CELL)
+            candidates = self._grid.get(cell, ())
+        else:
+            candidates = range(len(self._span_rects))
+        for i in candidates:
+            if self._span_rects[i].contains(pos):
+                return i
+        return -1
 
     # ---- selection / highlight ----
 
@@ -126,17 +334,24 @@ class PDFPageWidget(QWidget):
         if char_start < 0 or char_end < 0:
             self.update()
             return
-        for i, (s, e) in enumerate(self._span_char_ranges):
-            if s < char_end and e > char_start:
-                self._tts_highlight_spans.append(i)
+        # Ranges are ascending: start at the first span ending after char_start
+        ranges = self._span_char_ranges
+        i = bisect_right(self._span_ends, char_start)
+        while i < len(ranges) and ranges[i][0] < char_end:
+            self._tts_highlight_spans.append(i)
+            i += 1
         self.update()
 
     def find_text_position(self, search_text: str, start_from: int = 0) -> tuple[int, int]:
+        """Locate search_text in the page; positions are indices into _full_text."""
         search_clean = " ".join(search_text.lower().split())
-        full_clean   = " ".join(self._full_text.lower().split())
-        pos = full_clean.find(search_clean, start_from)
+        if not search_clean:
+            return -1, -1
+        norm_start = bisect_left(self._norm_to_orig, start_from)
+        pos = self._full_text_norm.find(search_clean, norm_start)
         if pos >= 0:
-            return pos, pos + len(search_clean)
+            end = pos + len(search_clean) - 1
+            return self._norm_to_orig[pos], self._norm_to_orig[end] + 1
         return -1, -1
 
     def get_selected_text(self) -> str:
@@ -147,6 +362,8 @@ class PDFPageWidget(QWidget):
     # ---- paint ----
 
     def paintEvent(self, event: QPaintEvent):
+        # Widen by the highlight pen so outlines straddling the edge still draw
+        dirty = QRectF(event.rect()).adjusted(-2, -2, 2, 2)
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
@@ -157,26 +374,12 @@ class PDFPageWidget(QWidget):
         if self._tts_highlight_spans:
             painter.setBrush(QBrush(self._tts_color))
             painter.setPen(QPen(QColor(234, 179, 8), 2))
-            for idx in self._tts_highlight_spans:
-                if 0 <= idx < len(self._text_spans):
-                    span = self._text_spans[idx]
-                    rect = QRectF(
-                        span.bbox.x() * self._scale, span.bbox.y() * self._scale,
-                        span.bbox.width() * self._scale, span.bbox.height() * self._scale,
-                    )
-                    painter.drawRoundedRect(rect, 3, 3)
+            painter.drawPath(self._highlight_path(self._tts_highlight_spans, 3, dirty))
 
         if self._show_selection and self._selected_spans and not self._tts_highlight_spans:
             painter.setBrush(QBrush(self._selection_color))
             painter.setPen(Qt.PenStyle.NoPen)
-            for idx in self._selected_spans:
-                if 0 <= idx < len(self._text_spans):
-                    span = self._text_spans[idx]
-                    rect = QRectF(
-                        span.bbox.x() * self._scale, span.bbox.y() * self._scale,
-                        span.bbox.width() * self._scale, span.bbox.height() * self._scale,
-                    )
-                    painter.drawRoundedRect(rect, 2, 2)
+            painter.drawPath(self._highlight_path(self._selected_spans, 2, dirty))
 
         if self._is_selecting and self._selection_start and self._selection_end:
             painter.setBrush(QBrush(QColor(99, 102, 241, 30)))
@@ -184,6 +387,22 @@ class PDFPageWidget(QWidget):
             rect = QRect(self._selection_start, self._selection_end).normalized()
             painter.drawRect(rect)
 
+    def _highlight_path(self, indices: List[int], radius: float,
+                        dirty: QRectF) -> QPainterPath:
+        """
+        Highlighted span rects inside the dirty region as one path, so each
+        layer is a single draw call.
+        """
+        path = QPainterPath()
+        path.setFillRule(Qt.FillRule.WindingFill)   # overlaps fill once, no holes
+        n = len(self._span_rects)
+        for idx in indices:
+            if 0 <= idx < n:
+                rect = self._span_rects[idx]
+                if rect.intersects(dirty):
+                    path.addRoundedRect(rect, radius, radius)
+        return path
+
     # ---- mouse ----
 
     def mousePressEvent(self, event: QMouseEvent):
@@ -198,11 +417,17 @@ class PDFPageWidget(QWidget):
     def mouseMoveEvent(self, event: QMouseEvent):
         if self._is_selecting:
             self._selection_end = event.pos()
+            if not self._selection_timer.isActive():
+                self._selection_timer.start()
+
+    def _apply_selection_update(self):
+        if self._is_selecting:
             self._update_selection()
             self.update()
 
     def mouseReleaseEvent(self, event: QMouseEvent):
         if event.button() == Qt.MouseButton.LeftButton and self._is_selecting:
+            self._selection_timer.stop()
             self._is_selecting = False
             self._selection_end = event.pos()
             self._update_selection()
@@ -212,31 +437,20 @@ class PDFPageWidget(QWidget):
             self.update()
 
     def mouseDoubleClickEvent(self, event: QMouseEvent):
-        pos = event.pos()
-        for i, span in enumerate(self._text_spans):
-            scaled = QRectF(
-                span.bbox.x() * self._scale, span.bbox.y() * self._scale,
-                span.bbox.width() * self._scale, span.bbox.height() * self._scale,
-            )
-            if scaled.contains(pos.toPointF()):
-                self._selected_spans = [i]
-                self._show_selection = True
-                self.text_selected.emit(span.text)
-                self.update()
-                break
+        i = self._span_at(event.pos().toPointF())
+        if i >= 0:
+            self._selected_spans = [i]
+            self._show_selection = True
+            self.text_selected.emit(self._text_spans[i].text)
+            self.update()
 
     def _update_selection(self):
         if not self._selection_start or not self._selection_end:
             return
-        sel_rect = QRect(self._selection_start, self._selection_end).normalized()
-        self._selected_spans = []
-        for i, span in enumerate(self._text_spans):
-            span_rect = QRect(
-                int(span.bbox.x() * self._scale), int(span.bbox.y() * self._scale),
-                int(span.bbox.width() * self._scale), int(span.bbox.height() * self._scale),
-            )
-            if sel_rect.intersects(span_rect):
-                self._selected_spans.append(i)
+        sel_rect = QRectF(QRect(self._selection_start, self._selection_end).normalized())
+        self._selected_spans = [
+            i for i in self._spans_near(sel_rect) if sel_rect.intersects(self._span_rects[i])
+        ]
 
     def contextMenuEvent(self, event):
         selected = self.get_selected_text()
@@ -252,6 +466,11 @@ class PDFPageWidget(QWidget):
 PAGE_GAP = 12        # px between pages
 RENDER_RADIUS = 2    # render current ±N pages
 POOL_SIZE = RENDER_RADIUS * 2 + 1
+PAGE_CACHE_BYTES = 256 * 1024 * 1024   # pixel memory of rendered pages kept (32-bit)
+PREFETCH_AHEAD = 2   # pages past the render window prefetched in the scroll direction
+PREFETCH_BEHIND = 1  # ... and against it
+PREFETCH_IDLE_MS = 400   # scroll quiet time before prefetching starts
+SPAN_CACHE_SIZE = 64  # pages whose text spans are kept; spans don't depend on zoom/theme
 
 
 class _Canvas(QWidget):
@@ -319,7 +538,7 @@ class _Canvas(QWidget):
             pw = self._pool[slot]
             pw.assign(page_index, pixmap, text_spans, scale)
             pw.move(
-                (self.width() - pixmap.width()) // 2,
+                (self.width() - pw.width()) // 2,
                 self._page_tops[page_index],
             )
             pw.show()
@@ -341,7 +560,7 @@ class _Canvas(QWidget):
         pw = self._pool[slot]
         pw.assign(page_index, pixmap, text_spans, scale)
         pw.move(
-            (self.width() - pixmap.width()) // 2,
+            (self.width() - pw.width()) // 2,
             self._page_tops[page_index],
         )
         pw.show()
@@ -392,21 +611,59 @@ class PDFViewerWidget(QWidget):
 
     text_selected = pyqtSignal(str)
     current_page_changed = pyqtSignal(int)   # 0-indexed
+    viewport_ready = pyqtSignal()            # first show; viewport has real geometry
+    _render_requested = pyqtSignal(int, str, object, bool)   # generation, path, key, want spans
+    _text_requested = pyqtSignal(int, str, int)              # generation, path, page
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self._dark_mode = True
+        self._viewport_ready = False
         self._doc: Optional[fitz.Document] = None
         self._zoom: float = 1.0
+        self._dpr: float = 1.0   # device pixel ratio of the screen we are on
         self._page_count: int = 0
         self._current_page: int = 0
+        self._scroll_direction: int = 1   # +1 reading forward, -1 backward
         self._current_read_position: int = 0
 
+        # (page_index, zoom, dark_mode, dpr) → (pixmap, scale), LRU order
+        self._page_cache: OrderedDict[tuple, tuple] = OrderedDict()
+        self._page_cache_bytes: int = 0   # width*height*4 summed over _page_cache
+        # page_index → (text spans in PDF points, plain text), reused across
+        # zoom and theme changes
+        self._span_cache: OrderedDict[int, tuple[List[TextSpan], str]] = OrderedDict()
+
+        # All rasterisation happens in one render process, driven from a worker
+        # thread; MuPDF work stays serialised and never blocks the GUI thread
+        # on the GIL. Results arrive in _on_rendered.
+        self._generation: int = 0            # bumped per document; drops stale results
+        self._render_pending: set[tuple] = set()
+        self._text_pending: set[int] = set()
+        self._slot_keys: dict[int, tuple] = {}   # assigned page → key it was drawn with
+        self._window: tuple[int, int] = (0, -1)  # pages currently kept in the pool
+        self._render_thread = QThread(self)
+        self._render_worker = PageRenderWorker()
+        self._render_worker.moveToThread(self._render_thread)
+        self._render_requested.connect(self._render_worker.render)
+        self._text_requested.connect(self._render_worker.extract)
+        self._render_worker.extracted.connect(self._on_text_extracted)
+        self._render_worker.rendered.connect(self._on_rendered)
+        self._render_thread.started.connect(self._render_worker.start)
+        self._render_thread.start()
+
         self._scroll_timer = QTimer(self)
         self._scroll_timer.setSingleShot(True)
         self._scroll_timer.setInterval(80)
         self._scroll_timer.timeout.connect(self._on_scroll_settled)
 
+        # Speculative renders wait until the user has stopped scrolling, so
+        # they never queue ahead of pages that are about to become visible
+        self._prefetch_timer = QTimer(self)
+        self._prefetch_timer.setSingleShot(True)
+        self._prefetch_timer.setInterval(PREFETCH_IDLE_MS)
+        self._prefetch_timer.timeout.connect(self._prefetch)
+
         self._setup_ui()
 
     def _setup_ui(self):
@@ -427,6 +684,16 @@ class PDFViewerWidget(QWidget):
         layout.addWidget(self.scroll_area)
         self._update_background()
 
+    def showEvent(self, event):
+        super().showEvent(event)
+        if not self._viewport_ready:
+            self._viewport_ready = True
+            self._dpr = self.devicePixelRatioF() or 1.0
+            handle = self.window().windowHandle()
+            if handle is not None:
+                handle.screenChanged.connect(self._on_screen_changed)
+            self.viewport_ready.emit()
+
     # ---- public API ----
 
     def load_document(self, doc: fitz.Document, zoom: float, dark_mode: bool):
@@ -436,6 +703,7 @@ class PDFViewerWidget(QWidget):
         self._current_page = 0
         self._current_read_position = 0
         self._page_count = len(doc)
+        self._reset_caches()
         self._build_layout()
         self.scroll_area.verticalScrollBar().setValue(0)
         self._on_scroll_settled()
@@ -451,9 +719,7 @@ class PDFViewerWidget(QWidget):
         self._dark_mode = dark_mode
         self._update_background()
         if self._doc is not None:
-            # Release all pool slots so they re-render with new colours
-            for pi in list(self._canvas.all_assigned_pages()):
-                self._canvas.release_page(pi)
+            # Pages keep their old colours until the re-render lands
             self._on_scroll_settled()
 
     def go_to_page(self, page_index: int):
@@ -475,6 +741,11 @@ class PDFViewerWidget(QWidget):
     def current_page(self) -> int:
         return self._current_page
 
+    def page_text(self, page_index: int) -> Optional[str]:
+        """Plain text of a page the viewer has already rendered, else None."""
+        entry = self._span_cache.get(page_index)
+        return entry[1] if entry is not None else None
+
     # ---- TTS / selection ----
 
     def highlight_text(self, text: str):
@@ -533,14 +804,32 @@ class PDFViewerWidget(QWidget):
         self._doc = None
         self._page_count = 0
         self._current_read_position = 0
+        self._reset_caches()
+
+    def shutdown(self):
+        """Stop the render thread and process. The widget must not be used afterwards."""
+        self.clear()
+        self._render_thread.quit()
+        self._render_thread.wait()
+        self._render_worker.stop()
 
     # ---- internal ----
 
+    def _reset_caches(self):
+        self._generation += 1
+        self._render_worker.generation = self._generation
+        self._render_pending.clear()
+        self._text_pending.clear()
+        self._slot_keys.clear()
+        self._page_cache.clear()
+        self._page_cache_bytes = 0
+        self._span_cache.clear()
+
     def _build_layout(self):
         """Compute page positions and resize the canvas. O(n) but only on load/zoom."""
         if self._doc is None:
             return
-        scale = self._zoom * 1.5
+        scale = self._zoom
         page_tops: List[int] = []
         page_sizes: List[tuple[int, int]] = []
         y = PAGE_GAP
@@ -565,15 +854,24 @@ class PDFViewerWidget(QWidget):
         # Release all pool slots — sizes may have changed
         for pi in list(self._canvas.all_assigned_pages()):
             self._canvas.release_page(pi)
+        self._slot_keys.clear()
+
+    def _key(self, page_index: int) -> tuple:
+        return (page_index, self._zoom, self._dark_mode, self._dpr)
+
+    def _on_screen_changed(self, _screen):
+        dpr = self.devicePixelRatioF() or 1.0
+        if dpr != self._dpr:
+            self._dpr = dpr
+            self._on_scroll_settled()
 
     def _update_background(self):
         bg = "#000000" if self._dark_mode else "#ffffff"
-        self.scroll_area.setStyleSheet(
-            f"QScrollArea {{ background-color:{bg}; border:none; }}"
-        )
+        self.scroll_area.setStyleSheet(get_pdf_viewer_stylesheet(self._dark_mode))
         self._canvas.set_bg(QColor(bg))
 
     def _on_scroll_value_changed(self, _):
+        self._prefetch_timer.stop()
         self._scroll_timer.start()
 
     def _on_scroll_settled(self):
@@ -586,59 +884,159 @@ class PDFViewerWidget(QWidget):
 
         visible = self._canvas.page_at_y(max(0, viewport_mid))
         if visible != self._current_page:
+            self._scroll_direction = 1 if visible > self._current_page else -1
             self._current_page = visible
             self.current_page_changed.emit(visible)
 
         lo = max(0, visible - RENDER_RADIUS)
         hi = min(self._page_count - 1, visible + RENDER_RADIUS)
 
+        self._window = (lo, hi)
+
         # Release pages outside the window
         for pi in list(self._canvas.all_assigned_pages()):
             if not (lo <= pi <= hi):
                 self._canvas.release_page(pi)
+                self._slot_keys.pop(pi, None)
 
-        # Render pages inside the window
+        # Render pages inside the window that are missing or drawn with stale settings
         for pi in range(lo, hi + 1):
-            if not self._canvas.is_assigned(pi):
+            if self._slot_keys.get(pi) != self._key(pi):
                 self._render_page(pi)
 
-    def _render_page(self, page_index: int):
+        self._prefetch_timer.start()
+
+    def _prefetch(self):
+        """Queue background renders just outside the window, favouring the scroll direction."""
         if self._doc is None:
             return
-        try:
-            page = self._doc[page_index]
-            scale = self._zoom * 1.5
-            mat = fitz.Matrix(scale, scale)
-            pix = page.get_pixmap(matrix=mat, alpha=False)
-            if self._dark_mode:
-                pix.invert_irect()
-            img = QImage(
-                pix.samples, pix.width, pix.height, pix.stride,
-                QImage.Format.Format_RGB888,
-            )
-            pixmap = QPixmap.fromImage(img.copy())
-            text_spans = self._extract_text_spans(page)
-            self._canvas.assign_slot(page_index, pixmap, text_spans, scale)
-        except Exception:
-            pass
+        lo, hi = self._window
+        forward = self._scroll_direction > 0
+        n_after = PREFETCH_AHEAD if forward else PREFETCH_BEHIND
+        n_before = PREFETCH_BEHIND if forward else PREFETCH_AHEAD
+        after = range(hi + 1, hi + 1 + n_after)
+        before = range(lo - 1, lo - 1 - n_before, -1)
+        for pi in (*after, *before) if forward else (*before, *after):
+            if not (0 <= pi < self._page_count):
+                continue
+            key = self._key(pi)
+            if key not in self._page_cache:
+                # Pixels only: text is extracted if the page is actually shown
+                self._request_render(key, want_spans=False)
+
+    def _request_render(self, key: tuple, want_spans: bool):
+        file_path = self._doc.name if self._doc is not None else ""
+        if not file_path or key in self._render_pending:
+            return
+        self._render_pending.add(key)
+        self._render_requested.emit(self._generation, file_path, key, want_spans)
 
-    def _extract_text_spans(self, page: fitz.Page) -> List[TextSpan]:
-        spans = []
-        try:
-            for block in page.get_text("dict")["blocks"]:
-                if block.get("type") != 0:
-                    continue
-                for line in block.get("lines", []):
-                    for span in line.get("spans", []):
-                        text = span.get("text", "").strip()
-                        if not text:
-                            continue
-                        bbox = span.get("bbox", [0, 0, 0, 0])
-                        spans.append(TextSpan(
-                            text=text,
-                            bbox=QRectF(bbox[0], bbox[1],
-                                        bbox[2] - bbox[0], bbox[3] - bbox[1]),
-                        ))
-        except Exception:
-            pass
-        return spans
+    def _request_text(self, page_index: int):
+        file_path = self._doc.name if self._doc is not None else ""
+        if not file_path or page_index in self._text_pending:
+            return
+        self._text_pending.add(page_index)
+        self._text_requested.emit(self._generation, file_path, page_index)
+
+    def _store_text(self, page_index: int, text_spans: List[TextSpan], page_text: str):
+        self._span_cache[page_index] = (text_spans, page_text)
+        if len(self._span_cache) > SPAN_CACHE_SIZE:
+            self._span_cache.popitem(last=False)
+
+    def _on_rendered(self, generation: int, key: tuple, result):
+        if generation != self._generation:
+            return
+        self._render_pending.discard(key)
+        if result is None:
+            return
+        img, text_spans, page_text, scale = result
+        page_index = key[0]
+        if text_spans is not None:
+            self._store_text(page_index, text_spans, page_text)
+        cached = self._page_cache.get(key)
+        if cached is None:
+            pixmap = QPixmap.fromImage(img, Qt.ImageConversionFlag.NoFormatConversion)
+            pixmap.setDevicePixelRatio(key[3])
+            cached = (pixmap, scale)
+            self._cache_page(key, cached)
+
+        # Show it if the page is still in the window at the current settings
+        lo, hi = self._window
+        if (key == self._key(page_index)
+                and lo <= page_index <= hi
+                and self._slot_keys.get(page_index) != key):
+            self._show_page(page_index, key, cached)
+
+    def _on_text_extracted(self, generation: int, page_index: int, result):
+        if generation != self._generation:
+            return
+        self._text_pending.discard(page_index)
+        if result is None:
+            return
+        self._store_text(page_index, *result)
+        pw = self._canvas.widget_for_page(page_index)
+        if pw is not None:
+            pw.set_text_spans(result[0])
+
+    def _render_page(self, page_index: int):
+        if self._doc is None:
+            return
+        key = self._key(page_index)
+        cached = self._page_cache.get(key)
+        if cached is not None:
+            self._page_cache.move_to_end(key)
+        else:
+            cached = self._invert_cached(key)
+            if cached is None:
+                self._request_render(key, want_spans=page_index not in self._span_cache)
+                return
+        self._show_page(page_index, key, cached)
+
+    def _show_page(self, page_index: int, key: tuple, entry: tuple):
+        pixmap, scale = entry
+        text = self._span_cache.get(page_index)
+        if text is not None:
+            self._span_cache.move_to_end(page_index)
+            text_spans = text[0]
+        else:
+            # Prefetched without text: show the pixels now, attach spans later
+            text_spans = []
+            self._request_text(page_index)
+        self._canvas.assign_slot(page_index, pixmap, text_spans, scale)
+        self._slot_keys[page_index] = key
+
+    def _invert_cached(self, key: tuple) -> Optional[tuple]:
+        """
+        Derive a page from its cached opposite-theme render. Dark mode is a
+        plain RGB inversion, so a theme toggle needs no MuPDF work at all.
+        """
+        page_index, zoom, dark_mode, dpr = key
+        opposite = self._page_cache.get((page_index, zoom, not dark_mode, dpr))
+        if opposite is None:
+            return None
+        pixmap, scale = opposite
+        img = pixmap.toImage()
+        img.invertPixels()
+        inverted = QPixmap.fromImage(img)
+        inverted.setDevicePixelRatio(dpr)
+        cached = (inverted, scale)
+        self._cache_page(key, cached)
+        return cached
+
+    @staticmethod
+    def _entry_bytes(entry: tuple) -> int:
+        pixmap = entry[0]
+        return pixmap.width() * pixmap.height() * 4
+
+    def _cache_page(self, key: tuple, entry: tuple):
+        """Insert a render, evicting least recently used ones past PAGE_CACHE_BYTES."""
+        old = self._page_cache.pop(key, None)
+        if old is not None:
+            self._page_cache_bytes -= self._entry_bytes(old)
+        self._page_cache[key] = entry
+        self._page_cache_bytes += self._entry_bytes(entry)
+        # Sized in bytes, not pages: one page at high zoom on a HiDPI screen
+        # can weigh as much as dozens at 100%. The newest entry always stays.
+        while self._page_cache_bytes > PAGE_CACHE_BYTES and len(self._page_cache) > 1:
+            _key, evicted = self._page_cache.popitem(last=False)
+            self._page_cache_bytes -= self._entry_bytes(evicted)
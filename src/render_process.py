@@ -0,0 +1,117 @@
+"""
+Page rasterisation for the render process.
+
+MuPDF holds the GIL for the whole of a get_pixmap call, so drawing on a
+thread of the GUI process still freezes its event loop. PageRenderWorker
+(pdf_viewer.py) runs render_server in a spawned child instead. This module
+imports fitz only — no Qt — so that child stays small.
+"""
+
+import fitz  # PyMuPDF
+
+
+TILE_THRESHOLD = 32 * 1024 * 1024   # RGB bytes above which a page is drawn in tiles
+TILE_PX = 1024                      # tile edge in device pixels
+
+
+def _get_pixmap_tiled(page: fitz.Page, mat: fitz.Matrix, dark_mode: bool) -> fitz.Pixmap:
+    """
+    Draw a large page tile by tile into one destination pixmap, so MuPDF's
+    working buffers stay tile-sized instead of page-sized.
+
+    Tiles are laid out on the destination's device-pixel grid and each clip
+    is mapped back through the inverse matrix, so rotated and cropped pages
+    tile without gaps or overlaps. The output is not byte-identical to a
+    full-page render: MuPDF anti-aliases differently under any clip smaller
+    than the page, across the whole tile and not only at the seams, by up to
+    about 30 levels per channel on a test page at 2.5x.
+    """
+    bounds = (page.rect * mat).irect
+    dest = fitz.Pixmap(fitz.csRGB, bounds, False)
+    dest.clear_with(255)
+    inverse = ~mat
+    for y in range(bounds.y0, bounds.y1, TILE_PX):
+        for x in range(bounds.x0, bounds.x1, TILE_PX):
+            cell = fitz.IRect(x, y, min(x + TILE_PX, bounds.x1), min(y + TILE_PX, bounds.y1))
+            tile = page.get_pixmap(matrix=mat, alpha=False, clip=fitz.Rect(cell) * inverse)
+            if dark_mode:
+                tile.invert_irect()
+            # MuPDF may round the clip out by a pixel; copy only this cell
+            dest.copy(tile, cell)
+            tile = None
+    return dest
+
+
+def _rasterize(page: fitz.Page, scale: float, dark_mode: bool) -> fitz.Pixmap:
+    mat = fitz.Matrix(scale, scale)
+    rect = page.rect * mat
+    if rect.width * rect.height * 3 > TILE_THRESHOLD:
+        return _get_pixmap_tiled(page, mat, dark_mode)
+    pix = page.get_pixmap(matrix=mat, alpha=False)
+    if dark_mode:
+        pix.invert_irect()
+    return pix
+
+
+def _extract_page_words(page: fitz.Page) -> tuple[list, str]:
+    # One text layout pass feeds both the word boxes and the plain text TTS
+    # reads (same flags as a bare page.get_text()). Word boxes come back as
+    # one flat list built in MuPDF's C code, in block/line reading order:
+    # (x0, y0, x1, y1, word, block, line, word_no)
+    tp = page.get_textpage(flags=fitz.TEXTFLAGS_TEXT)
+    try:
+        words = [w[:5] for w in page.get_text("words", textpage=tp) if w[4].strip()]
+    except Exception:
+        words = []
+    return words, page.get_text("text", textpage=tp)
+
+
+def render_server(conn):
+    """
+    Entry point of the render process. MuPDF holds the GIL for the whole of
+    a get_pixmap call, so rasterising on a thread of the GUI process still
+    freezes the event loop; out here it can only stall this process.
+
+    Requests arrive as tuples on ``conn``; every one except None gets a reply:
+      ("render", path, generation, page, scale, dark, want_text)
+          → (width, height, stride, words, text) then the RGB samples as
+            one bytes message (the one copy each page makes), words and
+            text None unless asked for; or None on failure
+      ("text", path, generation, page) → (words, text) or None
+      None → exit
+    """
+    doc, doc_key = None, None
+    while True:
+        try:
+            request = conn.recv()
+        except EOFError:
+            return
+        if request is None:
+            return
+        op = request[0]
+        file_path, generation, page_index = request[1:4]
+        try:
+            if doc_key != (file_path, generation):
+                if doc is not None:
+                    doc.close()
+                    # Drop the old document's fonts/images from MuPDF's global store
+                    fitz.TOOLS.store_shrink(100)
+                doc, doc_key = None, None
+                doc = fitz.open(file_path)
+                doc_key = (file_path, generation)
+            page = doc[page_index]
+            if op == "render":
+                scale, dark_mode, want_text = request[4:]
+                pix = _rasterize(page, scale, dark_mode)
+                words, text = _extract_page_words(page) if want_text else (None, None)
+                header = (pix.width, pix.height, pix.stride, words, text)
+            else:
+                pix = None
+                header = _extract_page_words(page)
+        except Exception:
+            conn.send(None)
+            continue
+        conn.send(header)
+        if pix is not None:
+            conn.send_bytes(pix.samples_mv)
+            pix = None
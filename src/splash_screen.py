@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 from PyQt6.QtCore import (
-    Qt, QTimer, QPropertyAnimation, QEasingCurve,
+    Qt, QPropertyAnimation, QEasingCurve,
     pyqtSignal, QRect, QPoint, QSize,
     QSequentialAnimationGroup, QParallelAnimationGroup,
 )
@@ -11,10 +12,21 @@ from PyQt6.QtGui import (
     QPainter, QColor, QFont, QPainterPath, QPen, QPixmap,
 )
 from PyQt6.QtWidgets import (
-    QWidget, QApplication, QMainWindow, QGraphicsOpacityEffect,
+    QWidget, QApplication, QMainWindow, QGraphicsOpacityEffect, QLabel,
 )
 
 
+# Platforms without a GPU-backed compositor, where every graphics-effect frame
+# is a full offscreen raster pass
+_SOFTWARE_PLATFORMS = ("offscreen", "minimal", "vnc", "linuxfb")
+
+
+def _software_rendering() -> bool:
+    if os.environ.get("LIBGL_ALWAYS_SOFTWARE") or os.environ.get("QT_OPENGL") == "software":
+        return True
+    return QApplication.platformName() in _SOFTWARE_PLATFORMS
+
+
 # ---------- Logo widget (pure QPainter, no graphics effects on children) ------
 
 class _Logo(QWidget):
@@ -30,7 +42,14 @@ class _Logo(QWidget):
         if image_path and image_path.exists():
             pm = QPixmap(str(image_path))
             if not pm.isNull():
-                self._pixmap = pm
+                # Smooth-scale once to the largest size the logo is drawn at;
+                # paint frames during the shrink animation then only blit it.
+                inset_size = size - 2 - 2 * int((size - 2) * 0.18)
+                self._pixmap = pm.scaled(
+                    inset_size, inset_size,
+                    Qt.AspectRatioMode.KeepAspectRatio,
+                    Qt.TransformationMode.SmoothTransformation,
+                )
         self.setFixedSize(size, size)
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
 
@@ -55,14 +74,13 @@ class _Logo(QWidget):
         if self._pixmap:
             inset = int(d * 0.18)
             target = r.adjusted(inset, inset, -inset, -inset)
-            scaled = self._pixmap.scaled(
-                target.size(),
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation,
+            fitted = self._pixmap.size().scaled(
+                target.size(), Qt.AspectRatioMode.KeepAspectRatio,
             )
-            ox = target.x() + (target.width()  - scaled.width())  // 2
-            oy = target.y() + (target.height() - scaled.height()) // 2
-            p.drawPixmap(ox, oy, scaled)
+            ox = target.x() + (target.width()  - fitted.width())  // 2
+            oy = target.y() + (target.height() - fitted.height()) // 2
+            p.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+            p.drawPixmap(QRect(ox, oy, fitted.width(), fitted.height()), self._pixmap)
         else:
             font = QFont("Georgia", max(10, int(d * 0.42)), QFont.Weight.Light)
             p.setFont(font)
@@ -116,30 +134,41 @@ class SplashScreen(QWidget):
         self._logo.move(cx, cy)
         self._logo_start_rect = QRect(cx, cy, self._LOGO_LARGE, self._LOGO_LARGE)
 
-        # Wordmark below logo
+        # Wordmark below logo. Title and subtitle always fade together, and the
+        # text never changes, so they are laid out once in a scratch widget and
+        # grabbed into a single pixmap: each fade frame is then one alpha blit
+        # rather than a repaint of two styled labels.
         ink   = "#ffffff" if dark_mode else "#0a0a0a"
         muted = "#888888" if dark_mode else "#777777"
-        from PyQt6.QtWidgets import QLabel
-        self._title = QLabel("AKSHARA", self)
-        self._title.setStyleSheet(
+        text_widget = QWidget()
+        text_widget.setStyleSheet("background:transparent;")
+
+        title = QLabel("AKSHARA", text_widget)
+        title.setStyleSheet(
             f"font-family:Georgia,serif;font-size:36px;font-weight:300;"
             f"letter-spacing:12px;color:{ink};background:transparent;"
         )
-        self._title.adjustSize()
-        self._title.move(
-            (screen.width() - self._title.width()) // 2,
-            cy + self._LOGO_LARGE + 20,
-        )
+        title.adjustSize()
 
-        self._sub = QLabel("PDF · FOCUS · ANALYTICS", self)
-        self._sub.setStyleSheet(
+        sub = QLabel("PDF · FOCUS · ANALYTICS", text_widget)
+        sub.setStyleSheet(
             f"font-size:11px;letter-spacing:3.5px;color:{muted};background:transparent;"
         )
-        self._sub.adjustSize()
-        self._sub.move(
-            (screen.width() - self._sub.width()) // 2,
-            cy + self._LOGO_LARGE + 64,
+        sub.adjustSize()
+
+        wm_w = max(title.width(), sub.width())
+        title.move((wm_w - title.width()) // 2, 0)
+        sub.move((wm_w - sub.width()) // 2, 44)
+        text_widget.resize(wm_w, 44 + sub.height())
+
+        self._wordmark = QLabel(self)
+        self._wordmark.setStyleSheet("background:transparent;")
+        self._wordmark.setPixmap(text_widget.grab())
+        self._wordmark.setGeometry(
+            (screen.width() - wm_w) // 2, cy + self._LOGO_LARGE + 20,
+            wm_w, 44 + sub.height(),
         )
+        text_widget.deleteLater()
 
         # Opacity effect on logo
         self._logo_op = QGraphicsOpacityEffect()
@@ -148,28 +177,41 @@ class SplashScreen(QWidget):
 
         self._text_op = QGraphicsOpacityEffect()
         self._text_op.setOpacity(0.0)
-        self._title.setGraphicsEffect(self._text_op)
-
-        self._sub_op = QGraphicsOpacityEffect()
-        self._sub_op.setOpacity(0.0)
-        self._sub.setGraphicsEffect(self._sub_op)
-
-        # Main window opacity for fade-in
-        self._win_op = QGraphicsOpacityEffect()
-        self._win_op.setOpacity(0.0)
-        target = self._win.centralWidget() or self._win
-        target.setGraphicsEffect(self._win_op)
+        self._wordmark.setGraphicsEffect(self._text_op)
+
+        # Main window opacity for fade-in. Fading the whole central widget
+        # re-renders it offscreen every frame; on software rasterisers the
+        # window is simply revealed under the travelling logo instead.
+        self._win_op: QGraphicsOpacityEffect | None = None
+        if not _software_rendering():
+            self._win_op = QGraphicsOpacityEffect()
+            self._win_op.setOpacity(0.0)
+            target = self._win.centralWidget() or self._win
+            target.setGraphicsEffect(self._win_op)
 
     def start(self):
         # Main window is already maximized (set in _setup_window), keep it hidden
         # until the travel phase reveals it
         self._win.hide()
         self.show()
-        QTimer.singleShot(100, self._phase_fadein)
+
+        # The whole intro is one Qt-driven timeline: pauses replace timer chaining
+        seq = QSequentialAnimationGroup(self)
+        seq.addPause(100)
+        seq.addAnimation(self._phase_fadein())
+        seq.addPause(500)
+        travel = self._phase_travel()
+        seq.addAnimation(travel)
+        seq.currentAnimationChanged.connect(
+            lambda anim: self._win.show() if anim is travel else None
+        )
+        seq.finished.connect(self._phase_done)
+        seq.start()
+        self._intro = seq
 
     # ---- phase 1: fade in logo + text ----
 
-    def _phase_fadein(self):
+    def _phase_fadein(self) -> QParallelAnimationGroup:
         dur = 600
 
         a_logo = QPropertyAnimation(self._logo_op, b"opacity", self)
@@ -177,31 +219,21 @@ class SplashScreen(QWidget):
         a_logo.setStartValue(0.0); a_logo.setEndValue(1.0)
         a_logo.setEasingCurve(QEasingCurve.Type.OutCubic)
 
-        a_title = QPropertyAnimation(self._text_op, b"opacity", self)
-        a_title.setDuration(dur); a_title.setStartValue(0.0); a_title.setEndValue(1.0)
-        a_title.setEasingCurve(QEasingCurve.Type.OutCubic)
-
-        a_sub = QPropertyAnimation(self._sub_op, b"opacity", self)
-        a_sub.setDuration(dur); a_sub.setStartValue(0.0); a_sub.setEndValue(1.0)
-        a_sub.setEasingCurve(QEasingCurve.Type.OutCubic)
+        a_text = QPropertyAnimation(self._text_op, b"opacity", self)
+        a_text.setDuration(dur); a_text.setStartValue(0.0); a_text.setEndValue(1.0)
+        a_text.setEasingCurve(QEasingCurve.Type.OutCubic)
 
         grp = QParallelAnimationGroup(self)
         grp.addAnimation(a_logo)
-        grp.addAnimation(a_title)
-        grp.addAnimation(a_sub)
-        grp.finished.connect(lambda: QTimer.singleShot(500, self._phase_travel))
-        grp.start()
-        self._fadein_grp = grp
+        grp.addAnimation(a_text)
+        return grp
 
     # ---- phase 2: travel to top-left corner ----
 
-    def _phase_travel(self):
+    def _phase_travel(self) -> QParallelAnimationGroup:
         a_text = QPropertyAnimation(self._text_op, b"opacity", self)
         a_text.setDuration(300); a_text.setStartValue(1.0); a_text.setEndValue(0.0)
 
-        a_sub = QPropertyAnimation(self._sub_op, b"opacity", self)
-        a_sub.setDuration(300); a_sub.setStartValue(1.0); a_sub.setEndValue(0.0)
-
         # Logo travels to screen top-left (splash covers the full screen)
         end_rect = QRect(
             self._screen.x() + self._CORNER_X,
@@ -215,25 +247,24 @@ class SplashScreen(QWidget):
         a_geom.setEndValue(end_rect)
         a_geom.setEasingCurve(QEasingCurve.Type.InOutCubic)
 
-        # Reveal maximized main window beneath the splash
-        self._win.show()
-        a_win = QPropertyAnimation(self._win_op, b"opacity", self)
-        a_win.setDuration(900)
-        a_win.setStartValue(0.0); a_win.setEndValue(1.0)
-        a_win.setEasingCurve(QEasingCurve.Type.OutCubic)
-
         grp = QParallelAnimationGroup(self)
         grp.addAnimation(a_text)
-        grp.addAnimation(a_sub)
         grp.addAnimation(a_geom)
-        grp.addAnimation(a_win)
-        grp.finished.connect(self._phase_done)
-        grp.start()
-        self._travel_grp = grp
+
+        if self._win_op is not None:
+            # Reveals the maximized main window beneath the splash (shown by
+            # start() when this phase begins)
+            a_win = QPropertyAnimation(self._win_op, b"opacity", self)
+            a_win.setDuration(900)
+            a_win.setStartValue(0.0); a_win.setEndValue(1.0)
+            a_win.setEasingCurve(QEasingCurve.Type.OutCubic)
+            grp.addAnimation(a_win)
+        return grp
 
     def _phase_done(self):
-        target = self._win.centralWidget() or self._win
-        target.setGraphicsEffect(None)
+        if self._win_op is not None:
+            target = self._win.centralWidget() or self._win
+            target.setGraphicsEffect(None)
         self.finished.emit()
         self.close()
 
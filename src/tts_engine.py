@@ -1,5 +1,10 @@
+import hashlib
+import os
+from bisect import bisect_right
+import queue
 import threading
 import re
+from pathlib import Path
 from typing import Optional, List
 from PyQt6.QtCore import QObject, pyqtSignal
 
@@ -9,15 +14,51 @@ try:
     from kokoro import KPipeline
     import torch
     import numpy as np
-    import simpleaudio as sa
+    import sounddevice as sd
     _KOKORO_AVAILABLE = True
 except ImportError as e:
     _KOKORO_AVAILABLE = False
     _KOKORO_IMPORT_ERROR = str(e)
 
 
+SAMPLE_RATE = 24000
+# Frames per stream write; pause and stop take effect between writes (100 ms)
+_WRITE_FRAMES = SAMPLE_RATE // 10
+
+# Short sentences are packed into one pipeline call up to this many characters
+_GROUP_CHARS = 200
+
+TTS_CACHE_MAX_BYTES = 500 * 1024 * 1024
+
+
+def default_tts_cache_dir() -> Path:
+    base = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(base) / "akshara" / "tts"
+
+
+_SENT_SPLIT = re.compile(r'(?<=[.!?])\s+')
+_WS_COLLAPSE = re.compile(r'\s+')
+
+
 def split_into_sentences(text: str) -> List[str]:
-    return [s.strip() for s in re.split(r'(?<=[.!?])\s+', text) if s.strip()]
+    return [s for s in (p.strip() for p in _SENT_SPLIT.split(text)) if s]
+
+
+def _tensor_to_pcm(audio):
+    # Clip/scale/cast on the tensor's own device, then copy
+    # half the bytes (int16 rather than float32) to the host
+    t = audio.clamp(-1.0, 1.0).mul_(32767.0).to(torch.int16)
+    return t.cpu().numpy().ravel()
+
+
+def _array_to_pcm(audio):
+    arr = np.asarray(audio, dtype=np.float32).ravel()
+    # Clip/scale in place and cast straight into the output array
+    pcm = np.empty(arr.size, dtype=np.int16)
+    np.clip(arr, -1.0, 1.0, out=arr)
+    np.multiply(arr, 32767.0, out=arr)
+    np.copyto(pcm, arr, casting='unsafe')
+    return pcm
 
 
 class TTSEngine(QObject):
@@ -33,8 +74,14 @@ class TTSEngine(QObject):
         self._is_paused = False
         self._should_stop = False
         self._thread: Optional[threading.Thread] = None
-        self._lock = threading.Lock()
-        self._play_obj = None
+        # One output stream for every utterance; only the speaking thread touches it
+        self._stream = None
+        # Set while not paused; the speaking thread blocks on it instead of polling
+        self._pause_event = threading.Event()
+        self._pause_event.set()
+        # Synthesised sentences as raw int16 PCM, keyed by voice/lang/speed/text
+        self._cache_dir = default_tts_cache_dir()
+        self._cache_bytes: Optional[int] = None   # measured on first store
         
         # Kokoro settings
         self._pipeline = None
@@ -42,9 +89,12 @@ class TTSEngine(QObject):
         self._lang_code = "a"
         self._ready = False
         self._speed = 1.0
+        self._pcm_converter = None   # resolved from the first chunk a pipeline yields
+        # Held while the pipeline loads, so speak() waits for a warm-up in progress
+        self._load_lock = threading.RLock()
         
-        # Text to speak
-        self._text = ""
+        # Chunks (sentences) waiting to be synthesised for the current utterance
+        self._pending: "queue.Queue[str]" = queue.Queue()
     
     def enable_hf(self, enabled: bool = True, voice: Optional[str] = None, lang_code: Optional[str] = None):
         if voice:
@@ -52,119 +102,359 @@ class TTSEngine(QObject):
         if lang_code:
             self._lang_code = lang_code
         self._ready = False
+        self._pcm_converter = None
     
     def _ensure_ready(self):
         """Lazy-load the Kokoro pipeline."""
-        if self._ready:
+        with self._load_lock:
+            if self._ready:
+                return
+
+            if not _KOKORO_AVAILABLE:
+                raise RuntimeError(f"Kokoro TTS not available: {_KOKORO_IMPORT_ERROR}")
+
+            self._pipeline = KPipeline(lang_code=self._lang_code, repo_id='hexgrad/Kokoro-82M')
+            if self._stream is None:
+                self._stream = sd.RawOutputStream(
+                    samplerate=SAMPLE_RATE, channels=1, dtype='int16', blocksize=2048,
+                )
+            self._ready = True
+
+    def warm_up(self):
+        """Load the pipeline and voice in the background ahead of the first speak()."""
+        if not _KOKORO_AVAILABLE or self._ready:
             return
-        
-        if not _KOKORO_AVAILABLE:
-            raise RuntimeError(f"Kokoro TTS not available: {_KOKORO_IMPORT_ERROR}")
-        
-        self._pipeline = KPipeline(lang_code=self._lang_code, repo_id='hexgrad/Kokoro-82M')
-        self._ready = True
+        threading.Thread(target=self._warm, daemon=True).start()
+
+    def _warm(self):
+        with self._load_lock:
+            try:
+                self._ensure_ready()
+                # One throwaway synthesis loads the voice and runs the model once
+                for _ in self._pipeline("A.", voice=self._voice, speed=1.0):
+                    pass
+            except Exception:
+                pass  # speak() retries the load and reports the error
     
     def speak(self, text: str):
         """Start speaking the given text."""
+        text = _WS_COLLAPSE.sub(' ', text).strip()
+        self.speak_stream(split_into_sentences(text) or [text])
+
+    def speak_stream(self, chunks: List[str]):
+        """Start speaking pre-split chunks in order.
+
+        Synthesis runs a couple of audio chunks ahead of playback, so
+        time-to-first-audio is bounded by the first chunk Kokoro yields and
+        later audio is ready when needed.
+        """
         self._full_stop()
-        
-        text = re.sub(r'\s+', ' ', text).strip()
-        if not text:
+
+        chunks = [c for c in (_WS_COLLAPSE.sub(' ', c).strip() for c in chunks) if c]
+        if not chunks:
             return
-        
-        self._text = text
+
+        pending: "queue.Queue[str]" = queue.Queue()
+        for chunk in chunks:
+            pending.put(chunk)
+        # Claim ownership first: a previous thread that outlived the join
+        # must see it has been superseded before any state is reset
+        self._thread = threading.Thread(target=self._speak_thread, args=(pending,), daemon=True)
+        self._pending = pending
         self._should_stop = False
         self._is_paused = False
+        self._pause_event.set()
         self._is_speaking = True
-        
-        self._thread = threading.Thread(target=self._speak_thread, daemon=True)
         self._thread.start()
-    
-    def _speak_thread(self):
-        """Main speaking thread."""
+
+    def _synth_thread(self, pending: "queue.Queue[str]", ready: "queue.Queue"):
+        """Synthesise pending chunks into `ready`; a None sentinel marks the end.
+
+        Each item is (sentence, pcm): sentence is set on the first int16 chunk
+        of a sentence and None on the ones that follow it. Sentences found in
+        the disk cache are queued whole without running the pipeline; the
+        rest are packed into groups of up to _GROUP_CHARS characters so short
+        sentences share one pipeline call.
+        """
+        def cancelled() -> bool:
+            return self._should_stop or pending is not self._pending
+
+        def put(item) -> None:
+            while not cancelled():
+                # Playback is not draining `ready` while paused; sleep until resumed
+                self._pause_event.wait()
+                try:
+                    ready.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    continue
+
+        try:
+            group: List[str] = []
+            while not cancelled():
+                try:
+                    sentence = pending.get_nowait()
+                except queue.Empty:
+                    break
+                cached = self._cache_load(sentence, self._voice_settings())
+                if cached is not None:
+                    # Keep order: whatever is grouped so far plays first
+                    self._synth_group(group, put, cancelled)
+                    group = []
+                    put((sentence, cached))
+                    continue
+                if group and sum(map(len, group)) + len(sentence) > _GROUP_CHARS:
+                    self._synth_group(group, put, cancelled)
+                    group = []
+                group.append(sentence)
+            self._synth_group(group, put, cancelled)
+        except Exception as e:
+            self.error_occurred.emit(f"TTS error: {e}")
+        finally:
+            put(None)
+            if cancelled():
+                # put() gives up once cancelled, but the speaking thread still
+                # needs the end marker: drop the unplayed audio to make room
+                while True:
+                    try:
+                        ready.get_nowait()
+                    except queue.Empty:
+                        break
+                ready.put_nowait(None)
+
+    def _synth_group(self, group: List[str], put, cancelled) -> None:
+        """Synthesise `group` in one pipeline call and queue it sentence by sentence.
+
+        Sentence starts are placed on the audio from Kokoro's per-token
+        timestamps (falling back to character position within a chunk when a
+        pipeline gives no tokens or timestamps), so word_changed still fires
+        per sentence. Sentences whose boundaries came
+        from timestamps are also cached individually.
+        """
+        if not group or cancelled():
+            return
+        # One snapshot for the call and the cache keys, so a rate or voice
+        # change mid-group can't file audio under settings it wasn't made with
+        settings = self._voice_settings()
+        voice, _lang_code, speed = settings
+        text = " ".join(group)
+        starts = []   # offset of each sentence in text
+        offset = 0
+        for sentence in group:
+            starts.append(offset)
+            offset += len(sentence) + 1
+
+        current = 0          # sentence receiving audio
+        announced = False    # whether group[current] has been queued yet
+        parts = []           # group[current]'s audio so far, for the cache
+        exact = True         # boundaries so far came from timestamps
+        cursor = 0           # search position for the next token in text
+
+        generator = self._pipeline(text, voice=voice, speed=speed)
+        for result in generator:
+            if cancelled():
+                return
+            if result.audio is None:
+                continue
+            pcm = self._to_pcm(result.audio)
+
+            # (character offset, start timestamp) of each token in this chunk
+            toks = []
+            if result.tokens:
+                for tok in result.tokens:
+                    pos = text.find(tok.text, cursor) if tok.text else -1
+                    if pos >= 0:
+                        cursor = pos + len(tok.text)
+                        toks.append((pos, tok.start_ts))
+            else:
+                # No tokens (non-English pipelines): place the sentence starts
+                # that fall inside this chunk's text by character position
+                chunk = (getattr(result, "graphemes", None) or "").strip()
+                pos = text.find(chunk, cursor) if chunk else -1
+                lo, hi = (pos, pos + len(chunk)) if pos >= 0 else (cursor, len(text))
+                toks = [(lo, None)] + [(start, None) for start in starts if lo < start < hi]
+                cursor = hi
+            if not toks and len(group) > 1:
+                exact = False    # no way to tell where sentences fall in this chunk
+            cuts = []        # (sample, sentence index) where a new sentence starts
+            last = current
+            for pos, start_ts in toks:
+                idx = bisect_right(starts, pos) - 1
+                if idx <= last:
+                    continue
+                if idx > last + 1:
+                    exact = False    # a sentence's tokens were not matched
+                if start_ts is None:
+                    exact = False
+                    span = max(1, cursor - toks[0][0])
+                    sample = (pos - toks[0][0]) * pcm.size // span
+                else:
+                    sample = int(start_ts * SAMPLE_RATE)
+                cuts.append((min(max(sample, 0), pcm.size), idx))
+                last = idx
+
+            prev = 0
+            for sample, idx in cuts + [(pcm.size, None)]:
+                sample = max(sample, prev)
+                piece = pcm[prev:sample]
+                prev = sample
+                if piece.size:
+                    put((None if announced else group[current], piece))
+                    announced = True
+                    parts.append(piece)
+                if idx is None:
+                    break
+                # group[current] is complete
+                if exact and parts:
+                    self._cache_store(self._cache_path(group[current], settings), parts)
+                current, announced, parts = idx, False, []
+
+        if exact and parts and not cancelled():
+            self._cache_store(self._cache_path(group[current], settings), parts)
+
+    def _speak_thread(self, pending: "queue.Queue[str]"):
+        """Main speaking thread: plays chunks as the synthesis thread produces them."""
+        def cancelled() -> bool:
+            # speak_stream() clears _should_stop for the next utterance, so a
+            # superseded thread is recognised by its queue instead
+            return self._should_stop or pending is not self._pending
+
         self.speech_started.emit()
         
         try:
             self._ensure_ready()
-            sentences = split_into_sentences(self._text) or [self._text]
+            # Bounded so synthesis stays at most two audio chunks ahead of playback
+            ready: queue.Queue = queue.Queue(maxsize=2)
+            threading.Thread(
+                target=self._synth_thread, args=(pending, ready), daemon=True,
+            ).start()
+            if not self._stream.active:
+                self._stream.start()
 
-            for sentence in sentences:
-                if self._should_stop:
-                    break
-                while self._is_paused and not self._should_stop:
-                    threading.Event().wait(0.1)
-                if self._should_stop:
+            while not cancelled():
+                try:
+                    item = ready.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+                if item is None:
                     break
+                sentence, pcm = item
 
-                self.word_changed.emit(sentence)
-                generator = self._pipeline(sentence, voice=self._voice, speed=self._speed)
-
-                for _graphemes, _phonemes, audio in generator:
-                    if self._should_stop:
-                        break
-                    while self._is_paused and not self._should_stop:
-                        threading.Event().wait(0.1)
-                    if self._should_stop:
+                if sentence is not None:
+                    self._pause_event.wait()
+                    if cancelled():
                         break
+                    self.word_changed.emit(sentence)
 
-                    arr = audio.cpu().numpy() if hasattr(audio, 'cpu') else np.asarray(audio)
-                    arr16 = (np.clip(arr, -1.0, 1.0) * 32767).astype(np.int16)
-
-                    with self._lock:
-                        if self._should_stop:
-                            break
-                        try:
-                            if self._play_obj is not None:
-                                self._play_obj.stop()
-                        except Exception:
-                            pass
-                        self._play_obj = sa.play_buffer(arr16.tobytes(), 1, 2, 24000)
-
-                    while True:
-                        with self._lock:
-                            if self._play_obj is None or not self._play_obj.is_playing():
-                                break
-                        if self._should_stop:
-                            with self._lock:
-                                if self._play_obj:
-                                    try:
-                                        self._play_obj.stop()
-                                    except Exception:
-                                        pass
-                            break
-                        if self._is_paused:
-                            with self._lock:
-                                if self._play_obj:
-                                    try:
-                                        self._play_obj.stop()
-                                    except Exception:
-                                        pass
-                            while self._is_paused and not self._should_stop:
-                                threading.Event().wait(0.1)
-                            break
-                        threading.Event().wait(0.02)
+                self._play(pcm, cancelled)
                     
         except Exception as e:
             self.error_occurred.emit(f"TTS error: {e}")
         finally:
-            self._is_speaking = False
-            self._is_paused = False
-            with self._lock:
-                self._play_obj = None
-            self.speech_finished.emit()
+            # A newer utterance owns the stream and the state; leave both alone
+            if self._thread is None or self._thread is threading.current_thread():
+                stream = self._stream
+                if stream is not None and stream.active:
+                    try:
+                        # Drain what is queued on a natural end; drop it on stop
+                        stream.abort() if self._should_stop else stream.stop()
+                    except Exception:
+                        pass
+                self._is_speaking = False
+                self._is_paused = False
+                self._pause_event.set()
+                self.speech_finished.emit()
+
+    def _to_pcm(self, audio):
+        """Convert one Kokoro audio chunk to a contiguous int16 array."""
+        convert = self._pcm_converter
+        if convert is None:
+            # A pipeline always yields the same type; pick the converter once
+            convert = _tensor_to_pcm if hasattr(audio, 'cpu') else _array_to_pcm
+            self._pcm_converter = convert
+        return convert(audio)
+
+    def _voice_settings(self) -> tuple:
+        """(voice, lang_code, speed) as they stand now; part of every cache key."""
+        return self._voice, self._lang_code, self._speed
+
+    def _cache_path(self, sentence: str, settings: tuple) -> Path:
+        voice, lang_code, speed = settings
+        key = hashlib.blake2b(
+            f"{voice}|{lang_code}|{speed}|{sentence}".encode(),
+            digest_size=16,
+        ).hexdigest()
+        return self._cache_dir / f"{key}.raw"
+
+    def _cache_load(self, sentence: str, settings: tuple):
+        """Return the cached PCM for `sentence` under `settings`, or None on a miss."""
+        path = self._cache_path(sentence, settings)
+        try:
+            cached = np.fromfile(path, dtype=np.int16)
+            os.utime(path)  # eviction is oldest-mtime first
+        except OSError:
+            return None
+        return cached if cached.size else None
+
+    def _cache_store(self, path: Path, parts) -> None:
+        """Write a sentence's PCM to the cache, trimming it past TTS_CACHE_MAX_BYTES."""
+        pcm = np.concatenate(parts)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write aside and rename so a reader never sees a partial file
+            tmp = path.with_suffix(f".{threading.get_ident()}.tmp")
+            pcm.tofile(tmp)
+            os.replace(tmp, path)
+            if self._cache_bytes is None:
+                self._cache_bytes = sum(f.stat().st_size for f in path.parent.glob("*.raw"))
+            else:
+                self._cache_bytes += pcm.nbytes
+            if self._cache_bytes > TTS_CACHE_MAX_BYTES:
+                self._trim_cache()
+        except OSError:
+            pass  # the cache is best-effort
+
+    def _trim_cache(self) -> None:
+        """Delete least recently used files until the cache is under 90% of its cap."""
+        files = []
+        for f in self._cache_dir.glob("*.raw"):
+            try:
+                st = f.stat()
+            except OSError:
+                continue
+            files.append((st.st_mtime, st.st_size, f))
+        files.sort()
+        total = sum(size for _mtime, size, _f in files)
+        for _mtime, size, f in files:
+            if total <= TTS_CACHE_MAX_BYTES * 0.9:
+                break
+            try:
+                f.unlink()
+                total -= size
+            except OSError:
+                pass
+        self._cache_bytes = total
+
+    def _play(self, pcm, cancelled):
+        """Write PCM to the output stream; blocks while the device buffer is full."""
+        stream = self._stream
+        for start in range(0, pcm.size, _WRITE_FRAMES):
+            if not self._pause_event.is_set():
+                stream.abort()  # drop buffered audio so the pause is immediate
+                self._pause_event.wait()
+                if cancelled():
+                    return
+                stream.start()
+            if cancelled():
+                return
+            stream.write(pcm[start:start + _WRITE_FRAMES])
     
     def _full_stop(self):
         """Stop all speech and wait for thread."""
         self._should_stop = True
         self._is_paused = False
-        
-        with self._lock:
-            if self._play_obj:
-                try:
-                    self._play_obj.stop()
-                except Exception:
-                    pass
-                self._play_obj = None
+        self._pause_event.set()
+        self._pending = queue.Queue()
         
         if self._thread and self._thread.is_alive():
             self._thread.join(timeout=1.0)
@@ -180,11 +470,13 @@ class TTSEngine(QObject):
         """Pause speaking."""
         if self._is_speaking and not self._is_paused:
             self._is_paused = True
+            self._pause_event.clear()
     
     def resume(self):
         """Resume speaking."""
         if self._is_paused:
             self._is_paused = False
+            self._pause_event.set()
     
     def set_rate_multiplier(self, multiplier: float):
         """Set speech rate (0.5x to 2.0x)."""
@@ -201,3 +493,9 @@ class TTSEngine(QObject):
     def cleanup(self):
         """Clean up resources."""
         self._full_stop()
+        if self._stream is not None:
+            try:
+                self._stream.close()
+            except Exception:
+                pass
+            self._stream = None
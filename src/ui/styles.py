@@ -2,7 +2,13 @@
 UI Styles — minimalist black/white with warm-amber accent.
 """
 
-FONT_FAMILY = "'Georgia', 'Times New Roman', serif"
+import re
+from functools import lru_cache
+from string import Formatter
+
+from PyQt6.QtGui import QFont
+
+FONT_FAMILIES = ("Georgia", "Times New Roman")   # UI serif, in fallback order
 MONO_FONT   = "'Ubuntu Mono', 'Courier New', monospace"
 
 ACCENT      = "#d8a85a"   # warm amber — used in ring, progress bars, active states
@@ -52,41 +58,41 @@ LIGHT_COLORS = {
     "highlight": "#ffe066",
 }
 
+# Indexed by dark_mode: (light, dark)
+_PALETTES = (LIGHT_COLORS, DARK_COLORS)
 
-def get_main_stylesheet(dark_mode: bool = True, base_px: int = 15) -> str:
-    C = DARK_COLORS if dark_mode else LIGHT_COLORS
-    sm  = max(base_px - 2, 9)   # small  (labels, muted text)
-    md  = base_px               # medium (base)
-    lg  = base_px + 2           # large  (buttons, menus)
 
-    return f"""
+# Main sheet template; fields are palette keys plus the text sizes and fonts.
+_MAIN_TEMPLATE = """
     /* ===== Global ===== */
+    /* The serif family is the application font (apply_app_font), not a
+       universal-selector rule, so widgets inherit it without per-widget
+       font resolution */
     * {{
-        font-family: {FONT_FAMILY};
         outline: none;
     }}
 
     QMainWindow, QDialog {{
-        background-color: {C["bg"]};
+        background-color: {bg};
     }}
 
     QWidget {{
         background-color: transparent;
-        color: {C["text"]};
+        color: {text};
         font-size: {md}px;
     }}
 
     /* ===== Toolbar ===== */
     QToolBar {{
-        background-color: {C["bg"]};
+        background-color: {bg};
         border: none;
-        border-bottom: 1px solid {C["border"]};
+        border-bottom: 1px solid {border};
         padding: 8px 14px;
         spacing: 6px;
     }}
 
     QToolBar::separator {{
-        background-color: {C["border"]};
+        background-color: {border};
         width: 1px;
         margin: 6px 10px;
     }}
@@ -94,8 +100,8 @@ def get_main_stylesheet(dark_mode: bool = True, base_px: int = 15) -> str:
     /* ===== Tool buttons ===== */
     QToolButton {{
         background-color: transparent;
-        color: {C["text"]};
-        border: 1px solid {C["border"]};
+        color: {text};
+        border: 1px solid {border};
         border-radius: 5px;
         padding: 6px 12px;
         font-size: {md}px;
@@ -103,46 +109,50 @@ def get_main_stylesheet(dark_mode: bool = True, base_px: int = 15) -> str:
     }}
 
     QToolButton:hover {{
-        background-color: {C["bg_hover"]};
-        border-color: {C["border_light"]};
+        background-color: {bg_hover};
+        border-color: {border_light};
     }}
 
     QToolButton:pressed {{
-        background-color: {C["bg_elevated"]};
+        background-color: {bg_elevated};
     }}
 
     QToolButton:disabled {{
-        color: {C["text_muted"]};
-        border-color: {C["border"]};
+        color: {text_muted};
+        border-color: {border};
     }}
 
-    QToolButton#playButton {{
-        background-color: {C["accent"]};
+    /* Shared by the toolbar and push-button variants of the play button */
+    QToolButton#playButton, QPushButton#playButton {{
+        background-color: {accent};
         color: #000000;
         border: none;
         font-weight: 600;
-        padding: 7px 16px;
-        border-radius: 5px;
         letter-spacing: 0.5px;
     }}
 
-    QToolButton#playButton:hover {{
+    QToolButton#playButton:hover, QPushButton#playButton:hover {{
         background-color: #e8bb6a;
     }}
 
+    QToolButton#playButton {{
+        padding: 7px 16px;
+        border-radius: 5px;
+    }}
+
     QToolButton#playButton:disabled {{
-        background-color: {C["border"]};
-        color: {C["text_muted"]};
+        background-color: {border};
+        color: {text_muted};
     }}
 
     QToolButton#stopButton {{
-        color: {C["error"]};
-        border-color: {C["error"]};
+        color: {error};
+        border-color: {error};
     }}
 
     QToolButton#stopButton:hover {{
-        background-color: {C["error"]};
-        color: {C["bg"]};
+        background-color: {error};
+        color: {bg};
     }}
 
     QToolButton#themeButton {{
@@ -153,7 +163,7 @@ def get_main_stylesheet(dark_mode: bool = True, base_px: int = 15) -> str:
     }}
 
     QToolButton#themeButton:hover {{
-        background-color: {C["bg_hover"]};
+        background-color: {bg_hover};
     }}
 
     QToolButton#zoomButton {{
@@ -166,8 +176,8 @@ def get_main_stylesheet(dark_mode: bool = True, base_px: int = 15) -> str:
     /* ===== Push buttons ===== */
     QPushButton {{
         background-color: transparent;
-        color: {C["text"]};
-        border: 1px solid {C["border"]};
+        color: {text};
+        border: 1px solid {border};
         border-radius: 5px;
         padding: 8px 18px;
         font-size: {md}px;
@@ -175,36 +185,24 @@ def get_main_stylesheet(dark_mode: bool = True, base_px: int = 15) -> str:
     }}
 
     QPushButton:hover {{
-        background-color: {C["bg_hover"]};
-        border-color: {C["border_light"]};
+        background-color: {bg_hover};
+        border-color: {border_light};
     }}
 
     QPushButton:checked {{
-        background-color: {C["accent"]};
+        background-color: {accent};
         color: #000000;
-        border-color: {C["accent"]};
+        border-color: {accent};
     }}
 
     QPushButton:disabled {{
-        color: {C["text_muted"]};
-        border-color: {C["border"]};
-    }}
-
-    QPushButton#playButton {{
-        background-color: {C["accent"]};
-        color: #000000;
-        border: none;
-        font-weight: 600;
-        letter-spacing: 0.5px;
-    }}
-
-    QPushButton#playButton:hover {{
-        background-color: #e8bb6a;
+        color: {text_muted};
+        border-color: {border};
     }}
 
     /* ===== Dock widgets ===== */
     QDockWidget {{
-        color: {C["text_secondary"]};
+        color: {text_secondary};
         font-size: 10px;
         letter-spacing: 2.5px;
         titlebar-close-icon: none;
@@ -212,17 +210,17 @@ def get_main_stylesheet(dark_mode: bool = True, base_px: int = 15) -> str:
     }}
 
     QDockWidget::title {{
-        background-color: {C["bg"]};
-        border-bottom: 1px solid {C["border"]};
+        background-color: {bg};
+        border-bottom: 1px solid {border};
         padding: 8px 14px;
         text-align: left;
         font-size: 10px;
         letter-spacing: 3px;
-        color: {C["text_muted"]};
+        color: {text_muted};
     }}
 
     QDockWidget > QWidget {{
-        background-color: {C["bg"]};
+        background-color: {bg};
         border: none;
     }}
 
@@ -230,12 +228,12 @@ def get_main_stylesheet(dark_mode: bool = True, base_px: int = 15) -> str:
     QSlider::groove:horizontal {{
         border: none;
         height: 2px;
-        background: {C["border"]};
+        background: {border};
         border-radius: 1px;
     }}
 
     QSlider::handle:horizontal {{
-        background: {C["accent"]};
+        background: {accent};
         width: 11px;
         height: 11px;
         margin: -5px 0;
@@ -247,24 +245,24 @@ def get_main_stylesheet(dark_mode: bool = True, base_px: int = 15) -> str:
     }}
 
     QSlider::sub-page:horizontal {{
-        background: {C["accent"]};
+        background: {accent};
         border-radius: 1px;
     }}
 
     /* ===== Spin boxes ===== */
     QSpinBox {{
-        background-color: {C["bg_elevated"]};
-        color: {C["text"]};
-        border: 1px solid {C["border"]};
+        background-color: {bg_elevated};
+        color: {text};
+        border: 1px solid {border};
         border-radius: 4px;
         padding: 4px 8px;
         min-width: 48px;
-        font-family: {MONO_FONT};
+        font-family: {mono_font};
         font-size: {md}px;
     }}
 
     QSpinBox:focus {{
-        border-color: {C["accent"]};
+        border-color: {accent};
     }}
 
     QSpinBox::up-button, QSpinBox::down-button {{
@@ -275,20 +273,20 @@ def get_main_stylesheet(dark_mode: bool = True, base_px: int = 15) -> str:
 
     /* ===== Labels ===== */
     QLabel {{
-        color: {C["text"]};
+        color: {text};
         background: transparent;
     }}
 
     QLabel#speedLabel, QLabel#zoomLabel {{
-        color: {C["text_secondary"]};
-        font-family: {MONO_FONT};
+        color: {text_secondary};
+        font-family: {mono_font};
         font-size: {sm}px;
         min-width: 38px;
     }}
 
     /* ===== Scroll bars ===== */
     QScrollArea {{
-        background-color: {C["bg"]};
+        background-color: {bg};
         border: none;
     }}
 
@@ -299,13 +297,13 @@ def get_main_stylesheet(dark_mode: bool = True, base_px: int = 15) -> str:
     }}
 
     QScrollBar::handle:vertical {{
-        background: {C["border_light"]};
+        background: {border_light};
         border-radius: 3px;
         min-height: 36px;
     }}
 
     QScrollBar::handle:vertical:hover {{
-        background: {C["text_muted"]};
+        background: {text_muted};
     }}
 
     QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical,
@@ -320,13 +318,13 @@ def get_main_stylesheet(dark_mode: bool = True, base_px: int = 15) -> str:
     }}
 
     QScrollBar::handle:horizontal {{
-        background: {C["border_light"]};
+        background: {border_light};
         border-radius: 3px;
         min-width: 36px;
     }}
 
     QScrollBar::handle:horizontal:hover {{
-        background: {C["text_muted"]};
+        background: {text_muted};
     }}
 
     QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal,
@@ -337,21 +335,21 @@ def get_main_stylesheet(dark_mode: bool = True, base_px: int = 15) -> str:
 
     /* ===== Status bar ===== */
     QStatusBar {{
-        background-color: {C["bg"]};
-        border-top: 1px solid {C["border"]};
-        color: {C["text_secondary"]};
+        background-color: {bg};
+        border-top: 1px solid {border};
+        color: {text_secondary};
         padding: 4px 16px;
         font-size: {sm}px;
-        font-family: {MONO_FONT};
+        font-family: {mono_font};
     }}
 
     QStatusBar::item {{ border: none; }}
 
     /* ===== Menu bar ===== */
     QMenuBar {{
-        background-color: {C["bg"]};
-        color: {C["text"]};
-        border-bottom: 1px solid {C["border"]};
+        background-color: {bg};
+        color: {text};
+        border-bottom: 1px solid {border};
         padding: 3px 6px;
         font-size: {md}px;
     }}
@@ -362,12 +360,12 @@ def get_main_stylesheet(dark_mode: bool = True, base_px: int = 15) -> str:
     }}
 
     QMenuBar::item:selected {{
-        background-color: {C["bg_hover"]};
+        background-color: {bg_hover};
     }}
 
     QMenu {{
-        background-color: {C["bg_elevated"]};
-        border: 1px solid {C["border_light"]};
+        background-color: {bg_elevated};
+        border: 1px solid {border_light};
         padding: 4px;
         border-radius: 6px;
     }}
@@ -379,21 +377,21 @@ def get_main_stylesheet(dark_mode: bool = True, base_px: int = 15) -> str:
     }}
 
     QMenu::item:selected {{
-        background-color: {C["accent"]};
+        background-color: {accent};
         color: #000000;
     }}
 
     QMenu::separator {{
         height: 1px;
-        background: {C["border"]};
+        background: {border};
         margin: 4px 8px;
     }}
 
     /* ===== Tooltips ===== */
     QToolTip {{
-        background-color: {C["bg_elevated"]};
-        color: {C["text"]};
-        border: 1px solid {C["border_light"]};
+        background-color: {bg_elevated};
+        color: {text};
+        border: 1px solid {border_light};
         padding: 5px 9px;
         font-size: 11px;
         border-radius: 4px;
@@ -401,29 +399,143 @@ def get_main_stylesheet(dark_mode: bool = True, base_px: int = 15) -> str:
 
     /* ===== Message box ===== */
     QMessageBox {{
-        background-color: {C["bg"]};
+        background-color: {bg};
     }}
 
     QMessageBox QLabel {{
-        color: {C["text"]};
+        color: {text};
     }}
     """
 
+_QSS_COMMENT = re.compile(r"/\*.*?\*/", re.S)
+_QSS_SPACE = re.compile(r"\s+")
+_QSS_PUNCT_SPACE = re.compile(r"\s*([{}:;,>])\s*")
+# In a format template only doubled braces are QSS; single ones are fields
+_QSS_TEMPLATE_PUNCT_SPACE = re.compile(r"\s*(\{\{|\}\}|[:;,>])\s*")
 
-def get_welcome_stylesheet(dark_mode: bool = True) -> str:
-    C = DARK_COLORS if dark_mode else LIGHT_COLORS
+
+def _minify_qss(qss: str, template: bool = False) -> str:
+    """Drop comments and layout whitespace: fewer bytes for Qt to tokenize per apply."""
+    qss = _QSS_COMMENT.sub("", qss)
+    qss = _QSS_SPACE.sub(" ", qss)
+    punct = _QSS_TEMPLATE_PUNCT_SPACE if template else _QSS_PUNCT_SPACE
+    return punct.sub(r"\1", qss).strip()
+
+
+# Minified and split once into (literal, field) pairs so rendering is a single join
+_MAIN_PARTS = tuple(
+    (literal, field)
+    for literal, field, _spec, _conv in Formatter().parse(_minify_qss(_MAIN_TEMPLATE, template=True))
+)
+
+
+# The main sheet depends on theme and text size (2 × 3 variants), so it is
+# built on first use and memoised; the theme-only sheets are built at import.
+
+@lru_cache(maxsize=6)
+def get_main_stylesheet(dark_mode: bool = True, base_px: int = 15) -> str:
+    C = _PALETTES[dark_mode]
+    params = {
+        **C,
+        "sm": max(base_px - 2, 9),   # small  (labels, muted text)
+        "md": base_px,               # medium (base)
+        "lg": base_px + 2,           # large  (buttons, menus)
+        "mono_font": MONO_FONT,
+    }
+    return "".join(
+        literal + ("" if field is None else str(params[field]))
+        for literal, field in _MAIN_PARTS
+    )
+
+
+def apply_app_font(app, point_size: int = 10) -> None:
+    """Set the serif UI font once on the application; every widget inherits it."""
+    font = QFont()
+    font.setFamilies(list(FONT_FAMILIES))
+    font.setStyleHint(QFont.StyleHint.Serif)
+    font.setPointSize(point_size)
+    app.setFont(font)
+
+
+def apply_main_stylesheet(widget, dark_mode: bool = True, base_px: int = 15) -> None:
+    """Set the memoised main sheet for this theme and text size on `widget`.
+
+    setStyleSheet re-polishes the whole widget tree even for an identical
+    string, so callers skip the call when nothing changed (MainWindow tracks
+    the theme it last applied).
+    """
+    widget.setStyleSheet(get_main_stylesheet(dark_mode, base_px))
+
+
+def _welcome_qss(dark_mode: bool) -> str:
+    C = _PALETTES[dark_mode]
+    hint = "#2a2a2a" if dark_mode else "#eeeeea"
+    # The page background lives here rather than in the palette: applying a
+    # sheet re-polishes the widget, and the main sheet's transparent QWidget
+    # rule would otherwise win.
     return f"""
     QWidget#welcomeWidget {{
         background-color: {C["bg"]};
     }}
+    #welcomeWidget QLabel#iconLabel {{ background: transparent; }}
+    #welcomeWidget QLabel#titleLabel {{
+        font-family: Georgia, serif;
+        font-size: 44px;
+        font-weight: 300;
+        letter-spacing: 10px;
+        color: {C["text"]};
+        background: transparent;
+    }}
+    #welcomeWidget QLabel#subtitleLabel {{
+        font-size: 11px;
+        letter-spacing: 3px;
+        color: {C["text_muted"]};
+        background: transparent;
+    }}
+    #welcomeWidget QPushButton#openButton {{
+        background-color: {C["accent"]};
+        color: #000000;
+        border: none;
+        border-radius: 6px;
+        padding: 14px 44px;
+        font-size: 12px;
+        font-weight: 700;
+        letter-spacing: 2px;
+    }}
+    #welcomeWidget QPushButton#openButton:hover {{ background-color: #e8bb6a; }}
+    #welcomeWidget QLabel#hintLabel, #welcomeWidget QLabel#shortcutLabel {{
+        font-family: {MONO_FONT};
+        font-size: 11px;
+        color: {C["text_muted"]};
+        background: transparent;
+    }}
+    #welcomeWidget QWidget#shortcutsPanel {{
+        background: {hint};
+        border-radius: 8px;
+    }}
     """
 
 
-def get_pdf_viewer_stylesheet(dark_mode: bool = True) -> str:
-    C = DARK_COLORS if dark_mode else LIGHT_COLORS
+def _pdf_viewer_qss(dark_mode: bool) -> str:
+    C = _PALETTES[dark_mode]
     return f"""
     QScrollArea {{
         background-color: {C["bg"]};
         border: none;
     }}
     """
+
+
+# Theme-only sheets are fully determined by the colour tables: build both
+# variants at import and index by dark_mode (light, dark).
+_WELCOME_QSS = (_minify_qss(_welcome_qss(False)), _minify_qss(_welcome_qss(True)))
+_PDF_VIEWER_QSS = (_minify_qss(_pdf_viewer_qss(False)), _minify_qss(_pdf_viewer_qss(True)))
+
+
+def get_welcome_stylesheet(dark_mode: bool = True) -> str:
+    return _WELCOME_QSS[dark_mode]
+
+
+def get_pdf_viewer_stylesheet(dark_mode: bool = True) -> str:
+    return _PDF_VIEWER_QSS[dark_mode]
+